@@ -8,6 +8,7 @@ This script shows how to:
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -16,6 +17,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 from metrics import MetricsCalculator, StatisticalAnalyzer, save_metrics_json
 
 
+def calculate_run(csv_file: str):
+    """Parse one run's CSV (module-level so it pickles for worker processes)."""
+    return MetricsCalculator().calculate_from_csv(csv_file)
+
+
 def analyze_single_run(csv_file: str):
     """Analyze a single test run."""
     print(f"Analyzing: {csv_file}")
@@ -34,25 +40,24 @@ def analyze_single_run(csv_file: str):
 def analyze_multiple_runs(csv_files: list, output_file: str):
     """Analyze multiple test runs and calculate statistics."""
     print(f"\nAnalyzing {len(csv_files)} runs...")
-    
-    calculator = MetricsCalculator()
+
     analyzer = StatisticalAnalyzer()
-    
-    # Collect metrics from all runs
-    bytes_per_report_values = []
-    duplicate_rate_values = []
-    
-    for csv_file in csv_files:
-        result = calculator.calculate_from_csv(csv_file)
-        bytes_per_report_values.append(result.bytes_per_report)
-        duplicate_rate_values.append(result.duplicate_rate)
-    
+
+    # Parse all runs in parallel: each CSV is independent, so the parses
+    # spread across worker processes. Each MetricsResult is kept so the
+    # median run can be picked by index instead of re-parsing its CSV.
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(calculate_run, csv_files))
+
+    bytes_per_report_values = [r.bytes_per_report for r in results]
+    duplicate_rate_values = [r.duplicate_rate for r in results]
+
     # Calculate statistics
     bytes_stats = analyzer.calculate_statistics(bytes_per_report_values)
     dup_stats = analyzer.calculate_statistics(duplicate_rate_values)
-    
+
     # Get median run for detailed metrics
-    median_result = calculator.calculate_from_csv(csv_files[len(csv_files) // 2])
+    median_result = results[len(results) // 2]
     
     # Prepare output data
     metrics_data = {
@@ -13,13 +13,27 @@ Test scenarios:
 Each scenario is run 5 times to gather statistical data.
 """
 
+import os
+import pickle
+import shutil
 import subprocess
 import sys
 import json
 import platform
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
+# Process-lifetime invariants, probed once instead of per test run
+_IS_LINUX = platform.system() == 'Linux'
+_TSHARK = shutil.which('tshark')
+_PYTHON = sys.executable
+
+try:
+    import orjson  # Rust-backed JSON, much faster parsing than stdlib
+except ImportError:
+    orjson = None
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -28,89 +42,177 @@ from metrics import StatisticalAnalyzer, save_metrics_json
 
 def is_linux():
     """Check if running on Linux."""
-    return platform.system() == 'Linux'
+    return _IS_LINUX
+
+
+def print_output_tail(stdout_path: Path, limit: int = 500):
+    """Print the last bytes of a child process log file for debugging."""
+    try:
+        tail = stdout_path.read_bytes()[-limit:]
+    except FileNotFoundError:
+        return
+
+    if tail:
+        print("Output tail:", tail.decode(errors='replace'))
+
+
+def run_scenario(name: str, cmd: List[str], output_json: str, log_file: str,
+                 timeout: int, env: Dict[str, str] = None) -> str:
+    """
+    Run one test scenario subprocess and confirm its metrics file exists.
+
+    This is the shared execution path for every scenario: child output
+    redirection, timeout handling, failure-tail printing, and the
+    metrics-file check live here once instead of in each run_*_test.
+
+    Args:
+        name: Scenario description used in error messages
+        cmd: Command list for the child process
+        output_json: Metrics JSON path the child is expected to produce
+        log_file: CSV log path (its .stdout.log sibling receives output)
+        timeout: Maximum child runtime in seconds
+        env: Optional environment for the child process
+
+    Returns:
+        Path to the metrics JSON file, or None on failure
+    """
+    stdout_path = Path(log_file).with_suffix('.stdout.log')
+
+    try:
+        with open(stdout_path, 'wb') as stdout_file:
+            result = subprocess.run(cmd, stdout=stdout_file,
+                                    stderr=subprocess.STDOUT,
+                                    timeout=timeout, env=env)
+
+        if result.returncode != 0:
+            print(f"[ERROR] {name} failed with exit code {result.returncode}")
+            print_output_tail(stdout_path)
+
+        # Confirm the metrics file exists; parsing is deferred so all runs
+        # can be batch-parsed in a single call (see collect_results)
+        if Path(output_json).exists():
+            return output_json
+
+        print(f"[ERROR] Output file not found: {output_json}")
+        print_output_tail(stdout_path)
+        return None
+
+    except subprocess.TimeoutExpired:
+        print(f"[ERROR] {name} timed out")
+        return None
+    except Exception as e:
+        print(f"[ERROR] {name} failed: {e}")
+        return None
+
+
+def collect_results(output_paths: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Batch-parse per-run metric JSON files into result dictionaries.
+
+    Runs launched with TELEMETRY_IPC set leave a pickle sidecar next to
+    their JSON file; loading that skips JSON decoding entirely on the
+    aggregation path (the JSON file stays for external consumers).
+    Remaining runs fall back to JSON: their raw bytes are concatenated
+    into a single array and parsed once, amortizing per-call parse
+    overhead. Failed runs (None paths) are preserved as None entries so
+    run-count accounting stays accurate.
+
+    Args:
+        output_paths: List of JSON file paths (or None for failed runs)
+
+    Returns:
+        List of parsed result dictionaries, aligned with output_paths
+    """
+    results: List[Dict[str, Any]] = [None] * len(output_paths)
+
+    json_pending = []
+    for i, p in enumerate(output_paths):
+        if p is None:
+            continue
+        path = Path(p)
+        try:
+            results[i] = pickle.loads(path.with_suffix('.pkl').read_bytes())
+        except FileNotFoundError:
+            json_pending.append((i, path))
 
+    if not json_pending:
+        return results
 
-def run_baseline_test(run_number: int, duration: int = 60, interval: int = 1) -> Dict[str, Any]:
+    if orjson is not None:
+        blob = b"[" + b",".join(p.read_bytes() for _, p in json_pending) + b"]"
+        parsed = orjson.loads(blob)
+    else:
+        blob = "[" + ",".join(p.read_text() for _, p in json_pending) + "]"
+        parsed = json.loads(blob)
+
+    for (i, _), data in zip(json_pending, parsed):
+        results[i] = data
+
+    return results
+
+
+def run_baseline_test(run_number: int, duration: int = 60, interval: int = 1,
+                      server_port: int = 5000) -> str:
     """
     Run baseline test scenario.
-    
+
     Args:
         run_number: Test run number (1-5)
         duration: Test duration in seconds
         interval: Reporting interval in seconds (1, 5, or 30)
-        
+        server_port: Server UDP port (unique per job when run in parallel)
+
     Returns:
-        Dictionary with test results
+        Path to the metrics JSON file, or None on failure
     """
     print(f"\n{'='*60}")
     print(f"BASELINE TEST - Run {run_number} (Interval: {interval}s)")
     print(f"{'='*60}")
-    
+
     log_file = f"output/baseline_interval{interval}_run{run_number}_telemetry.csv"
     output_json = f"output/baseline_interval{interval}_run{run_number}_metrics.json"
     pcap_file = f"output/baseline_interval{interval}_run{run_number}_capture.pcap"
-    
+
     cmd = [
-        sys.executable, 'scripts/test_baseline.py',
+        _PYTHON, 'scripts/test_baseline.py',
         '--duration', str(duration),
         '--interval', str(interval),
+        '--server-port', str(server_port),
         '--log-file', log_file,
         '--output-json', output_json
     ]
     
     # Enable packet capture for first 2 runs (requirement: at least 2 pcap files per scenario)
     # Only enable on Linux or if tshark is available on Windows
-    import shutil
-    enable_pcap = run_number <= 2 and (is_linux() or shutil.which('tshark') is not None)
-    
+    enable_pcap = run_number <= 2 and (_IS_LINUX or _TSHARK is not None)
+
     if enable_pcap:
         cmd.extend(['--enable-pcap', '--pcap-file', pcap_file])
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration + 20)
-        
-        # Print output for debugging
-        if result.returncode != 0:
-            print(f"[ERROR] Test failed with exit code {result.returncode}")
-            if result.stdout:
-                print("STDOUT:", result.stdout[:500])
-            if result.stderr:
-                print("STDERR:", result.stderr[:500])
-        
-        # Read results from JSON
-        if Path(output_json).exists():
-            with open(output_json, 'r') as f:
-                data = json.load(f)
-            print(f"✓ Run {run_number} completed successfully")
-            return data
-        else:
-            print(f"[ERROR] Output file not found: {output_json}")
-            if result.stdout:
-                print("Test output:", result.stdout[:500])
-            return None
-            
-    except subprocess.TimeoutExpired:
-        print(f"[ERROR] Baseline test run {run_number} timed out")
-        return None
-    except Exception as e:
-        print(f"[ERROR] Baseline test run {run_number} failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
 
+    # Ask the child to emit a pickle sidecar for our aggregation step
+    env = os.environ.copy()
+    env['TELEMETRY_IPC'] = 'file'
+
+    result = run_scenario(f"Baseline test run {run_number}", cmd,
+                          output_json, log_file, duration + 20, env=env)
+
+    if result is not None:
+        print(f"✓ Run {run_number} completed successfully")
 
-def run_loss_test(run_number: int, duration: int = 60, loss_pct: int = 5) -> Dict[str, Any]:
+    return result
+
+
+def run_loss_test(run_number: int, duration: int = 60, loss_pct: int = 5) -> str:
     """
     Run packet loss test scenario (Linux only).
-    
+
     Args:
         run_number: Test run number (1-5)
         duration: Test duration in seconds
         loss_pct: Packet loss percentage (0, 1, 5, 10)
-        
+
     Returns:
-        Dictionary with test results
+        Path to the metrics JSON file, or None on failure
     """
     if not is_linux():
         print("[SKIP] Packet loss test requires Linux")
@@ -124,13 +226,16 @@ def run_loss_test(run_number: int, duration: int = 60, loss_pct: int = 5) -> Dic
     output_json = f"output/loss{loss_pct}_run{run_number}_metrics.json"
     pcap_file = f"output/loss{loss_pct}_run{run_number}_capture.pcap"
     
-    # Set environment variable for pcap file (used by bash script)
-    import os
-    env = os.environ.copy()
-    env['PCAP_FILE'] = pcap_file
-    
+    # Pass run-specific output paths to the bash script so it writes
+    # directly to the final names; no post-hoc renames (and no shared
+    # fixed filenames between runs). They go on the sudo command line
+    # via env(1) because sudo's env_reset strips inherited variables.
     cmd = [
-        'sudo', 'bash', 'scripts/test_loss.sh',
+        'sudo', 'env',
+        f'PCAP_FILE={pcap_file}',
+        f'LOG_FILE={log_file}',
+        f'OUTPUT_JSON={output_json}',
+        'bash', 'scripts/test_loss.sh',
         '1001',  # device_id
         '1',     # interval
         str(duration),  # duration
@@ -138,45 +243,21 @@ def run_loss_test(run_number: int, duration: int = 60, loss_pct: int = 5) -> Dic
         '5000',  # server_port
         str(loss_pct)  # loss_percentage
     ]
-    
-    # Update log file and output json in the script by modifying environment
-    # Since the script uses fixed paths, we'll need to move files after
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration + 30, env=env)
-        
-        # Move output files to run-specific names
-        if Path('output/loss_telemetry.csv').exists():
-            Path('output/loss_telemetry.csv').rename(log_file)
-        
-        if Path('output/loss_metrics.json').exists():
-            Path('output/loss_metrics.json').rename(output_json)
-            
-            with open(output_json, 'r') as f:
-                data = json.load(f)
-            return data
-        else:
-            print(f"[ERROR] Output file not found")
-            return None
-            
-    except subprocess.TimeoutExpired:
-        print(f"[ERROR] Loss test run {run_number} timed out")
-        return None
-    except Exception as e:
-        print(f"[ERROR] Loss test run {run_number} failed: {e}")
-        return None
+
+    return run_scenario(f"Loss test run {run_number}", cmd,
+                        output_json, log_file, duration + 30)
 
 
-def run_delay_test(run_number: int, duration: int = 60) -> Dict[str, Any]:
+def run_delay_test(run_number: int, duration: int = 60) -> str:
     """
     Run delay/jitter test scenario (Linux only).
-    
+
     Args:
         run_number: Test run number (1-5)
         duration: Test duration in seconds
-        
+
     Returns:
-        Dictionary with test results
+        Path to the metrics JSON file, or None on failure
     """
     if not is_linux():
         print("[SKIP] Delay/jitter test requires Linux")
@@ -190,68 +271,64 @@ def run_delay_test(run_number: int, duration: int = 60) -> Dict[str, Any]:
     output_json = f"output/delay_run{run_number}_metrics.json"
     pcap_file = f"output/delay_run{run_number}_capture.pcap"
     
-    # Set environment variable for pcap file (used by bash script)
-    import os
-    env = os.environ.copy()
-    env['PCAP_FILE'] = pcap_file
-    
+    # Pass run-specific output paths on the sudo command line via
+    # env(1) — sudo's env_reset strips inherited variables — so the
+    # script writes directly to the final names
     cmd = [
-        'sudo', 'bash', 'scripts/test_delay.sh',
+        'sudo', 'env',
+        f'PCAP_FILE={pcap_file}',
+        f'LOG_FILE={log_file}',
+        f'OUTPUT_JSON={output_json}',
+        'bash', 'scripts/test_delay.sh',
         '1001',  # device_id
         '1',     # interval
         str(duration),  # duration
         '1',     # batch_size
         '5000'   # server_port
     ]
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration + 30, env=env)
-        
-        # Move output files to run-specific names
-        if Path('output/delay_telemetry.csv').exists():
-            Path('output/delay_telemetry.csv').rename(log_file)
-        
-        if Path('output/delay_metrics.json').exists():
-            Path('output/delay_metrics.json').rename(output_json)
-            
-            with open(output_json, 'r') as f:
-                data = json.load(f)
-            return data
-        else:
-            print(f"[ERROR] Output file not found")
-            return None
-            
-    except subprocess.TimeoutExpired:
-        print(f"[ERROR] Delay test run {run_number} timed out")
-        return None
-    except Exception as e:
-        print(f"[ERROR] Delay test run {run_number} failed: {e}")
-        return None
+
+    return run_scenario(f"Delay test run {run_number}", cmd,
+                        output_json, log_file, duration + 30)
 
 
-def calculate_statistics(results: List[Dict[str, Any]], metric_name: str) -> Dict[str, float]:
+# Metrics summarized for every scenario (column order used by summary tables)
+METRIC_KEYS = (
+    'bytes_per_report',
+    'packets_received',
+    'duplicate_rate',
+    'sequence_gap_count'
+)
+
+
+def summarize_metrics(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
     """
-    Calculate statistical summary for a specific metric.
-    
+    Calculate min/median/max for all standard metrics in one pass.
+
+    A single traversal of the result list fills one column per metric,
+    instead of re-walking every result dictionary once per metric name.
+
     Args:
         results: List of test result dictionaries
-        metric_name: Name of metric to analyze
-        
+
     Returns:
-        Dictionary with min, median, max
+        Dictionary mapping metric name to {'min', 'median', 'max'}
     """
-    values = []
-    
+    columns = {key: [] for key in METRIC_KEYS}
+
     for result in results:
         if result and 'metrics' in result:
-            if metric_name in result['metrics']:
-                values.append(result['metrics'][metric_name])
-    
-    if not values:
-        return {'min': 0, 'median': 0, 'max': 0}
-    
+            metrics = result['metrics']
+            for key in METRIC_KEYS:
+                if key in metrics:
+                    columns[key].append(metrics[key])
+
     analyzer = StatisticalAnalyzer()
-    return analyzer.calculate_statistics(values)
+
+    return {
+        key: (analyzer.calculate_statistics(values) if values
+              else {'min': 0, 'median': 0, 'max': 0})
+        for key, values in columns.items()
+    }
 
 
 def print_summary_table(scenario_name: str, results: List[Dict[str, Any]]):
@@ -274,21 +351,19 @@ def print_summary_table(scenario_name: str, results: List[Dict[str, Any]]):
         return
     
     print(f"Valid runs: {len(valid_results)}/{len(results)}")
-    
-    # Calculate statistics for each metric
-    metrics_to_analyze = [
-        'bytes_per_report',
-        'packets_received',
-        'duplicate_rate',
-        'sequence_gap_count'
-    ]
-    
+
+    # One traversal of the results fills every metric column; the old
+    # per-metric calculate_statistics calls re-walked the full result
+    # list once per metric name
+    stats_by_metric = summarize_metrics(valid_results)
+
     print(f"\n{'Metric':<25} {'Min':<12} {'Median':<12} {'Max':<12}")
     print("-" * 60)
-    
-    for metric in metrics_to_analyze:
-        stats = calculate_statistics(valid_results, metric)
-        
+
+    for metric in METRIC_KEYS:
+        stats = stats_by_metric[metric]
+
+
         if metric == 'duplicate_rate':
             # Format as percentage
             print(f"{metric:<25} {stats['min']*100:>10.2f}% {stats['median']*100:>10.2f}% {stats['max']*100:>10.2f}%")
@@ -364,19 +439,36 @@ def main():
     else:
         test_intervals = [1]  # Default: only 1 second
     
-    # Run baseline tests for each interval
+    # Run baseline tests for each interval. The runs are fully independent
+    # (each child gets its own UDP port and output files), so they execute
+    # concurrently in a process pool instead of serially: wall time drops
+    # from runs x intervals x duration to roughly duration x ceil(jobs/workers).
+    jobs = [(interval, i) for interval in test_intervals
+            for i in range(1, args.runs + 1)]
+    job_ports = {job: 5000 + offset for offset, job in enumerate(jobs)}
+
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+
+    print(f"\n{'='*60}")
+    print(f"RUNNING BASELINE TESTS ({len(jobs)} runs, {max_workers} parallel)")
+    print(f"{'='*60}")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            job: executor.submit(run_baseline_test, job[1], args.duration,
+                                 job[0], job_ports[job])
+            for job in jobs
+        }
+        job_paths = {job: future.result() for job, future in futures.items()}
+
     interval_results = []
-    
+
     for interval in test_intervals:
-        print(f"\n{'='*60}")
-        print(f"RUNNING BASELINE TESTS (Interval: {interval}s)")
-        print(f"{'='*60}")
-        
-        baseline_results = []
-        for i in range(1, args.runs + 1):
-            result = run_baseline_test(i, args.duration, interval)
-            baseline_results.append(result)
-        
+        baseline_paths = [job_paths[(interval, i)]
+                          for i in range(1, args.runs + 1)]
+
+        baseline_results = collect_results(baseline_paths)
+
         print_summary_table(f"Baseline (Interval: {interval}s)", baseline_results)
         
         # Store results with interval info
@@ -385,12 +477,7 @@ def main():
             interval_results.append({
                 'interval': interval,
                 'runs': len(valid_results),
-                'statistics': {
-                    'bytes_per_report': calculate_statistics(valid_results, 'bytes_per_report'),
-                    'packets_received': calculate_statistics(valid_results, 'packets_received'),
-                    'duplicate_rate': calculate_statistics(valid_results, 'duplicate_rate'),
-                    'sequence_gap_count': calculate_statistics(valid_results, 'sequence_gap_count')
-                }
+                'statistics': summarize_metrics(valid_results)
             })
     
     # Determine which loss rates to test
@@ -407,11 +494,12 @@ def main():
             print(f"RUNNING PACKET LOSS TESTS (Loss: {loss_pct}%)")
             print(f"{'='*60}")
             
-            loss_results = []
+            loss_paths = []
             for i in range(1, args.runs + 1):
-                result = run_loss_test(i, args.duration, loss_pct)
-                loss_results.append(result)
-            
+                loss_paths.append(run_loss_test(i, args.duration, loss_pct))
+
+            loss_results = collect_results(loss_paths)
+
             print_summary_table(f"Packet Loss ({loss_pct}%)", loss_results)
             
             # Store results with loss percentage info
@@ -420,12 +508,7 @@ def main():
                 loss_rate_results.append({
                     'loss_percentage': loss_pct,
                     'runs': len(valid_results),
-                    'statistics': {
-                        'bytes_per_report': calculate_statistics(valid_results, 'bytes_per_report'),
-                        'packets_received': calculate_statistics(valid_results, 'packets_received'),
-                        'duplicate_rate': calculate_statistics(valid_results, 'duplicate_rate'),
-                        'sequence_gap_count': calculate_statistics(valid_results, 'sequence_gap_count')
-                    }
+                    'statistics': summarize_metrics(valid_results)
                 })
     
     # Run delay tests (Linux only)
@@ -435,10 +518,12 @@ def main():
         print("RUNNING DELAY/JITTER TESTS")
         print(f"{'='*60}")
         
+        delay_paths = []
         for i in range(1, args.runs + 1):
-            result = run_delay_test(i, args.duration)
-            delay_results.append(result)
-        
+            delay_paths.append(run_delay_test(i, args.duration))
+
+        delay_results = collect_results(delay_paths)
+
         print_summary_table("Delay/Jitter", delay_results)
     
     # Aggregate results
@@ -471,12 +556,7 @@ def main():
         if valid_delay:
             aggregated_results['scenarios']['delay_jitter'] = {
                 'runs': len(valid_delay),
-                'statistics': {
-                    'bytes_per_report': calculate_statistics(valid_delay, 'bytes_per_report'),
-                    'packets_received': calculate_statistics(valid_delay, 'packets_received'),
-                    'duplicate_rate': calculate_statistics(valid_delay, 'duplicate_rate'),
-                    'sequence_gap_count': calculate_statistics(valid_delay, 'sequence_gap_count')
-                }
+                'statistics': summarize_metrics(valid_delay)
             }
     
     # Add note about plotting
@@ -484,9 +564,19 @@ def main():
         print("\n[INFO] Test data for plotting has been generated")
         print("[INFO] Run 'python scripts/generate_plots.py' to create visualizations")
     
-    # Save aggregated results
+    # Save aggregated results. The deeply nested aggregate dict is written
+    # directly from orjson's C encoder when available, skipping the
+    # recursive stdlib encoding; OPT_APPEND_NEWLINE keeps a trailing
+    # newline for downstream tooling.
     output_file = 'output/test_results.json'
-    save_metrics_json(aggregated_results, output_file)
+
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(
+            aggregated_results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        print(f"Metrics saved to: {output_file}")
+    else:
+        save_metrics_json(aggregated_results, output_file)
     
     print(f"\n{'='*60}")
     print("ALL TESTS COMPLETE")
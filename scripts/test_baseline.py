@@ -12,18 +12,216 @@ Test parameters:
 - Expected: ≥99% packet delivery, sequence numbers in order
 """
 
+# Stdlib modules used only on cold paths (argparse in main, csv in the
+# sequence-check fallback, platform/shutil in pcap startup) are imported
+# where they're used, keeping library-style imports of this module cheap
+import asyncio
+import os
+import pickle
 import subprocess
 import time
 import sys
-import csv
-import json
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Process-lifetime constants: the interpreter path for child commands
+# and the src directory, inserted once (a guarded insert keeps repeated
+# library imports from stacking duplicate sys.path entries)
+_PYTHON = sys.executable
+_SRC = str(Path(__file__).resolve().parent.parent / 'src')
+
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from metrics import MetricsCalculator, save_metrics_json
 
+# Optional vectorized CSV path (pandas + numpy). The import is deferred
+# to first use so short runs don't pay pandas' startup cost when the
+# stdlib fallback is all that's needed.
+pandas = None
+numpy = None
+_pandas_checked = False
+
+
+def _load_pandas():
+    """Import pandas and numpy for the vectorized CSV path on first use."""
+    global pandas, numpy, _pandas_checked
+
+    if _pandas_checked:
+        return pandas
+
+    _pandas_checked = True
+
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        return None
+
+    numpy = np
+    pandas = pd
+    return pandas
+
+
+async def _start_pcap(pcap_file, server_port):
+    """
+    Start packet capture (tcpdump on Linux, tshark on Windows).
+
+    Returns:
+        The capture subprocess, or None if no capture tool is available
+    """
+    import platform
+    import shutil
+
+    if platform.system() == 'Linux':
+        # Use tcpdump on Linux
+        if shutil.which('tcpdump'):
+            pcap_cmd = [
+                'tcpdump',
+                '-i', 'lo',
+                '-w', pcap_file,
+                'udp', 'port', str(server_port)
+            ]
+
+            try:
+                pcap_process = subprocess.Popen(
+                    pcap_cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                await asyncio.sleep(0.5)  # Give tcpdump time to start
+                print(f"  Packet capture started (tcpdump)")
+                return pcap_process
+            except Exception as e:
+                print(f"  [WARNING] Failed to start tcpdump: {e}")
+        else:
+            print("  [WARNING] tcpdump not found, skipping packet capture")
+
+    elif platform.system() == 'Windows':
+        # Use tshark on Windows (Wireshark CLI)
+        if shutil.which('tshark'):
+            pcap_cmd = [
+                'tshark',
+                '-i', 'Loopback',
+                '-w', pcap_file,
+                '-f', f'udp port {server_port}'
+            ]
+
+            try:
+                pcap_process = subprocess.Popen(
+                    pcap_cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                await asyncio.sleep(0.5)  # Give tshark time to start
+                print(f"  Packet capture started (tshark)")
+                return pcap_process
+            except Exception as e:
+                print(f"  [WARNING] Failed to start tshark: {e}")
+        else:
+            print("  [WARNING] tshark not found, skipping packet capture")
+            print("  [INFO] Install Wireshark to enable packet capture on Windows")
+
+    else:
+        print(f"  [WARNING] Packet capture not supported on {platform.system()}")
+
+    return None
+
+
+def _udp_port_bound(port):
+    """
+    Check the kernel's socket tables for a UDP socket on the given port.
+
+    Reads /proc/net/udp (and udp6); the local_address column carries the
+    port as four hex digits after the colon.
+    """
+    needle = ':%04X' % port
+
+    for table in ('/proc/net/udp', '/proc/net/udp6'):
+        try:
+            with open(table) as f:
+                next(f)  # header line
+                for line in f:
+                    fields = line.split()
+                    if len(fields) > 1 and fields[1].endswith(needle):
+                        return True
+        except OSError:
+            continue
+
+    return False
+
+
+async def _wait_server_ready(server_process, port, timeout=1.0):
+    """
+    Wait until the server has bound its UDP port (or crashed).
+
+    Instead of a fixed 1 s sleep, poll the kernel's UDP socket table
+    every 10 ms for the port. Typically returns within tens of
+    milliseconds; the timeout only caps pathological startups. Reading
+    /proc/net/udp is purely passive — unlike probing by bind, it cannot
+    steal the port from the server mid-startup, and it keeps junk
+    packets out of the server's stream.
+
+    On platforms without /proc/net/udp this falls back to the original
+    fixed settle delay.
+
+    Returns:
+        True once the port is bound, False if the server exited first
+    """
+    if not os.path.exists('/proc/net/udp'):
+        await asyncio.sleep(timeout)
+        return server_process.poll() is None
+
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        if server_process.poll() is not None:
+            return False
+
+        if _udp_port_bound(port):
+            return True
+
+        await asyncio.sleep(0.01)
+
+    return server_process.poll() is None
+
+
+async def _start_server(server_cmd, server_port):
+    """Start the collector server and wait until its port is bound."""
+    # The server's stdout is never inspected, so discard it instead of
+    # piping into a buffer nobody drains (which would grow for the whole
+    # run, or stall the server once the pipe fills). stderr stays piped:
+    # it only carries tracebacks, read on failure.
+    server_process = subprocess.Popen(
+        server_cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    await _wait_server_ready(server_process, server_port)
+
+    return server_process
+
+
+async def _start_processes(server_cmd, enable_pcap, pcap_file, server_port):
+    """
+    Launch packet capture and server concurrently.
+
+    Popen itself doesn't block; the startup settle delays do. Gathering
+    the two coroutines overlaps those waits, so startup costs the longer
+    of the two instead of their sum.
+
+    Returns:
+        Tuple of (pcap_process or None, server_process)
+    """
+    if enable_pcap:
+        return tuple(await asyncio.gather(
+            _start_pcap(pcap_file, server_port),
+            _start_server(server_cmd, server_port)
+        ))
+
+    return None, await _start_server(server_cmd, server_port)
+
 
 def run_baseline_test(device_id=1001, interval=1, duration=60, batch_size=1,
                      server_port=5000, log_file='output/baseline_telemetry.csv',
@@ -65,94 +263,28 @@ def run_baseline_test(device_id=1001, interval=1, duration=60, batch_size=1,
     # Ensure output directory exists
     Path(log_file).parent.mkdir(parents=True, exist_ok=True)
     
-    # Start packet capture if enabled
-    pcap_process = None
+    # Start packet capture (if enabled) and server concurrently: their
+    # startup settle delays overlap instead of adding up
     if enable_pcap:
         print("\n[0/4] Starting packet capture...")
-        
-        # Determine which capture tool to use
-        import platform
-        import shutil
-        
-        if platform.system() == 'Linux':
-            # Use tcpdump on Linux
-            if shutil.which('tcpdump'):
-                pcap_cmd = [
-                    'tcpdump',
-                    '-i', 'lo',
-                    '-w', pcap_file,
-                    'udp', 'port', str(server_port)
-                ]
-                
-                try:
-                    pcap_process = subprocess.Popen(
-                        pcap_cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    time.sleep(0.5)  # Give tcpdump time to start
-                    print(f"  Packet capture started (tcpdump)")
-                except Exception as e:
-                    print(f"  [WARNING] Failed to start tcpdump: {e}")
-                    pcap_process = None
-            else:
-                print("  [WARNING] tcpdump not found, skipping packet capture")
-        
-        elif platform.system() == 'Windows':
-            # Use tshark on Windows (Wireshark CLI)
-            if shutil.which('tshark'):
-                pcap_cmd = [
-                    'tshark',
-                    '-i', 'Loopback',
-                    '-w', pcap_file,
-                    '-f', f'udp port {server_port}'
-                ]
-                
-                try:
-                    pcap_process = subprocess.Popen(
-                        pcap_cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    time.sleep(0.5)  # Give tshark time to start
-                    print(f"  Packet capture started (tshark)")
-                except Exception as e:
-                    print(f"  [WARNING] Failed to start tshark: {e}")
-                    pcap_process = None
-            else:
-                print("  [WARNING] tshark not found, skipping packet capture")
-                print("  [INFO] Install Wireshark to enable packet capture on Windows")
-        
-        else:
-            print(f"  [WARNING] Packet capture not supported on {platform.system()}")
-    
-    # Start server in background
-    step_num = 1 if not enable_pcap else 1
-    print(f"\n[{step_num}/4] Starting collector server...")
+
+    print("\n[1/4] Starting collector server...")
     server_cmd = [
-        sys.executable, '-m', 'src.server',
+        _PYTHON, '-m', 'src.server',
         '--port', str(server_port),
         '--log-file', log_file
     ]
-    
-    server_process = subprocess.Popen(
-        server_cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
-    )
-    
-    # Wait for server to be ready
-    step_num = 2 if not enable_pcap else 2
-    print(f"[{step_num}/4] Waiting for server to be ready...")
-    time.sleep(1)
-    
+
+    print("[2/4] Waiting for server to be ready...")
+    pcap_process, server_process = asyncio.run(
+        _start_processes(server_cmd, enable_pcap, pcap_file, server_port))
+
     # Check if server is still running
     if server_process.poll() is not None:
         print("[ERROR] Server failed to start!")
-        output, _ = server_process.communicate()
-        print(output)
+        _, err = server_process.communicate()
+        if err:
+            print(err)
         
         # Stop packet capture if running
         if pcap_process:
@@ -166,7 +298,7 @@ def run_baseline_test(device_id=1001, interval=1, duration=60, batch_size=1,
     
     # Start client
     client_cmd = [
-        sys.executable, '-m', 'src.client',
+        _PYTHON, '-m', 'src.client',
         '--device-id', str(device_id),
         '--server-host', 'localhost',
         '--server-port', str(server_port),
@@ -176,57 +308,95 @@ def run_baseline_test(device_id=1001, interval=1, duration=60, batch_size=1,
     ]
     
     try:
-        # Run client and wait for completion
-        client_result = subprocess.run(
+        # Run the client under a watchdog loop. Its stdout is never read
+        # on success, so discard it rather than buffering a full run's
+        # output in memory; stderr is kept for failure diagnostics. The
+        # loop polls the server every second so a mid-run server crash
+        # aborts in seconds instead of burning the remaining duration.
+        client_process = subprocess.Popen(
             client_cmd,
-            capture_output=True,
-            text=True,
-            timeout=duration + 10  # Add buffer time
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
         )
-        
+
+        client_deadline = time.monotonic() + duration + 10  # Add buffer time
+
+        while True:
+            try:
+                client_process.wait(timeout=1)
+                break
+            except subprocess.TimeoutExpired:
+                if time.monotonic() > client_deadline:
+                    client_process.kill()
+                    client_process.wait()
+                    raise
+
+                if server_process.poll() is not None:
+                    print("[ERROR] Server crashed mid-run; aborting test")
+                    client_process.kill()
+                    client_process.wait()
+
+                    if pcap_process:
+                        pcap_process.kill()
+
+                    return None
+
+        if client_process.returncode != 0:
+            print(f"[ERROR] Client exited with code {client_process.returncode}")
+            client_err = client_process.stderr.read()
+            if client_err:
+                print(client_err)
+
+
         step_num = 4 if not enable_pcap else 4
         print(f"[{step_num}/4] Client completed. Stopping server...")
         
-        # Stop packet capture if running
+        # Stop packet capture and server together: SIGTERM both first,
+        # then wait on them under one shared deadline instead of two
+        # serial waits (up to 2 s + 5 s on slow shutdowns)
         if pcap_process:
             print("  Stopping packet capture...")
             pcap_process.terminate()
-            try:
-                pcap_process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                pcap_process.kill()
-                pcap_process.wait()
-            
+
+        server_process.terminate()
+
+        procs = [p for p in (pcap_process, server_process) if p is not None]
+        deadline = time.monotonic() + 5
+        while (any(p.poll() is None for p in procs)
+               and time.monotonic() < deadline):
+            time.sleep(0.05)
+
+        for p in procs:
+            if p.poll() is None:
+                if p is server_process:
+                    print("[WARNING] Server did not stop gracefully, forcing...")
+                p.kill()
+                p.wait()
+
+        if pcap_process:
             if Path(pcap_file).exists():
                 print(f"  Packet capture saved to: {pcap_file}")
             else:
                 print(f"  [WARNING] Packet capture file not found: {pcap_file}")
         
-        # Stop server gracefully
-        server_process.terminate()
-        
-        # Wait for server to finish (with timeout)
-        try:
-            server_process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            print("[WARNING] Server did not stop gracefully, forcing...")
-            server_process.kill()
-            server_process.wait()
-        
         print("\n" + "="*60)
         print("TEST EXECUTION COMPLETE")
         print("="*60)
         
-        # Calculate metrics from CSV log
+        # Calculate metrics and verify sequence order in one CSV pass
+        # (the parse itself reports a missing log file, so no separate
+        # existence probe is needed)
         print("\nCalculating metrics...")
-        
-        if not Path(log_file).exists():
+
+        calculator = MetricsCalculator()
+        try:
+            metrics, sequence_in_order = calculator.calculate_and_verify(
+                log_file, device_id)
+        except FileNotFoundError:
             print(f"[ERROR] Log file not found: {log_file}")
             return None
         
-        calculator = MetricsCalculator()
-        metrics = calculator.calculate_from_csv(log_file)
-        
         # Verify results
         print("\n" + "="*60)
         print("METRICS")
@@ -241,10 +411,13 @@ def run_baseline_test(device_id=1001, interval=1, duration=60, batch_size=1,
         delivery_rate = metrics.packets_received / metrics.packets_sent if metrics.packets_sent > 0 else 0
         print(f"Delivery rate: {delivery_rate:.4f} ({delivery_rate*100:.2f}%)")
         
-        # Verify sequence order
+        # Sequence order was checked in the same CSV pass as the metrics
         print("\nVerifying sequence order...")
-        sequence_in_order = verify_sequence_order(log_file, device_id)
-        
+        if sequence_in_order:
+            print("  All sequences in order")
+        else:
+            print("  Sequence numbers out of order")
+
         # Check test requirements
         print("\n" + "="*60)
         print("TEST VALIDATION")
@@ -328,19 +501,55 @@ def verify_sequence_order(csv_file, device_id):
     Returns:
         True if sequences are in order, False otherwise
     """
-    sequences = []
-    
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        
+    # Vectorized path: pandas parses the CSV in C and the monotonicity
+    # check becomes one diff over a contiguous int array instead of a
+    # per-row Python loop with int() conversions
+    if _load_pandas() is not None:
+        df = pandas.read_csv(
+            csv_file,
+            usecols=['device_id', 'seq', 'duplicate_flag'],
+            dtype={'device_id': 'int64', 'seq': 'int64',
+                   'duplicate_flag': 'string'}
+        )
+        mask = ((df['device_id'] == device_id)
+                & (df['duplicate_flag'].str.lower() != 'true'))
+        seq = df.loc[mask, 'seq'].to_numpy()
+
+        bad = numpy.flatnonzero(numpy.diff(seq) <= 0)
+        if bad.size:
+            i = bad[0]
+            print(f"  Sequence out of order: {seq[i]} -> {seq[i + 1]}")
+            return False
+
+        print(f"  All {len(seq)} sequences in order")
+        return True
+
+    import csv
+    from array import array
+
+    # array('q') packs sequences as 8-byte ints in one contiguous buffer
+    # instead of a list of ~28-byte Python int objects, so the final
+    # monotonicity scan streams through far less memory
+    sequences = array('q')
+
+    # csv.reader with integer column indices skips the per-row dict
+    # construction and field-name hashing DictReader would do. The 1 MiB
+    # buffer cuts read() syscalls, newline='' skips universal-newline
+    # translation (csv handles line endings itself), and telemetry rows
+    # are pure ASCII so the decoder can skip UTF-8 handling.
+    with open(csv_file, 'r', newline='', buffering=1 << 20,
+              encoding='ascii') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        di = header.index('device_id')
+        si = header.index('seq')
+        fi = header.index('duplicate_flag')
+
         for row in reader:
-            if int(row['device_id']) == device_id:
-                is_duplicate = row['duplicate_flag'].lower() == 'true'
-                
-                if not is_duplicate:
-                    seq = int(row['seq'])
-                    sequences.append(seq)
-    
+            if int(row[di]) == device_id and row[fi].lower() != 'true':
+                sequences.append(int(row[si]))
+
+
     # Check if sequences are monotonically increasing
     for i in range(1, len(sequences)):
         if sequences[i] <= sequences[i-1]:
@@ -351,15 +560,28 @@ def verify_sequence_order(csv_file, device_id):
     return True
 
 
-def main():
-    """Main entry point for baseline test script."""
+def _build_parser(defaults=None, epilog=None):
+    """
+    Build the baseline test argument parser.
+
+    Platform wrappers (e.g. test_baseline_windows.py) reuse this instead
+    of re-declaring every argument; they only override defaults.
+
+    Args:
+        defaults: Optional default overrides keyed by argument dest
+        epilog: Optional help epilog text
+
+    Returns:
+        Configured argparse.ArgumentParser
+    """
     import argparse
-    
+
     parser = argparse.ArgumentParser(
         description='Run baseline test for TinyTelemetry protocol',
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        epilog=epilog
     )
-    
+
     parser.add_argument(
         '--device-id',
         type=int,
@@ -422,9 +644,30 @@ def main():
         default=None,
         help='Path to packet capture file (default: output/baseline_capture.pcap)'
     )
-    
-    args = parser.parse_args()
-    
+
+    parser.add_argument(
+        '--scenario-name',
+        type=str,
+        default='baseline',
+        help='Test scenario name for output files'
+    )
+
+    if defaults:
+        parser.set_defaults(**defaults)
+
+    return parser
+
+
+def main(defaults=None, epilog=None):
+    """
+    Main entry point for baseline test script.
+
+    Args:
+        defaults: Optional argument-default overrides for platform wrappers
+        epilog: Optional help epilog (e.g. Windows impairment instructions)
+    """
+    args = _build_parser(defaults, epilog).parse_args()
+
     # Run test
     results = run_baseline_test(
         device_id=args.device_id,
@@ -433,7 +676,7 @@ def main():
         batch_size=args.batch_size,
         server_port=args.server_port,
         log_file=args.log_file,
-        scenario_name='baseline',
+        scenario_name=args.scenario_name,
         enable_pcap=args.enable_pcap,
         pcap_file=args.pcap_file
     )
@@ -444,7 +687,16 @@ def main():
     
     # Save metrics to JSON
     save_metrics_json(results, args.output_json)
-    
+
+    # When the master runner set TELEMETRY_IPC, also emit the results as a
+    # pickle sidecar: the runner aggregates from that, skipping the JSON
+    # decode entirely. The JSON file remains the format for external
+    # consumers (plots, manual inspection).
+    if os.environ.get('TELEMETRY_IPC'):
+        Path(args.output_json).with_suffix('.pkl').write_bytes(
+            pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))
+
+
     # Exit with appropriate code
     if results['validation']['passed']:
         sys.exit(0)
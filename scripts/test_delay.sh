@@ -25,8 +25,10 @@ INTERVAL=${2:-1}
 DURATION=${3:-60}
 BATCH_SIZE=${4:-1}
 SERVER_PORT=${5:-5000}
-LOG_FILE="output/delay_telemetry.csv"
-OUTPUT_JSON="output/delay_metrics.json"
+# Output paths may be overridden by the caller (run_all_tests.py sets
+# run-specific names so no post-hoc renames are needed)
+LOG_FILE="${LOG_FILE:-output/delay_telemetry.csv}"
+OUTPUT_JSON="${OUTPUT_JSON:-output/delay_metrics.json}"
 DELAY_MS=100
 JITTER_MS=10
 
@@ -26,8 +26,10 @@ DURATION=${3:-60}
 BATCH_SIZE=${4:-1}
 SERVER_PORT=${5:-5000}
 LOSS_PERCENT=${6:-5}
-LOG_FILE="output/loss_telemetry.csv"
-OUTPUT_JSON="output/loss_metrics.json"
+# Output paths may be overridden by the caller (run_all_tests.py sets
+# run-specific names so no post-hoc renames are needed)
+LOG_FILE="${LOG_FILE:-output/loss_telemetry.csv}"
+OUTPUT_JSON="${OUTPUT_JSON:-output/loss_metrics.json}"
 
 echo "============================================================"
 echo "PACKET LOSS TEST (Linux netem)"
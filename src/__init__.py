@@ -15,6 +15,7 @@ from .protocol import (
     SENSOR_TYPE_HUMIDITY,
     SENSOR_TYPE_VOLTAGE,
     HEADER_SIZE,
+    HEADER_STRUCT,
     MAX_PAYLOAD_SIZE,
     READING_SIZE,
     MAX_BATCH_SIZE,
@@ -23,7 +24,9 @@ from .protocol import (
     encode_header,
     decode_header,
     encode_data_payload,
+    encode_data_payload_soa,
     decode_data_payload,
+    count_readings,
 )
 
 __all__ = [
@@ -34,6 +37,7 @@ __all__ = [
     'SENSOR_TYPE_HUMIDITY',
     'SENSOR_TYPE_VOLTAGE',
     'HEADER_SIZE',
+    'HEADER_STRUCT',
     'MAX_PAYLOAD_SIZE',
     'READING_SIZE',
     'MAX_BATCH_SIZE',
@@ -42,5 +46,7 @@ __all__ = [
     'encode_header',
     'decode_header',
     'encode_data_payload',
+    'encode_data_payload_soa',
     'decode_data_payload',
+    'count_readings',
 ]
@@ -0,0 +1,43 @@
+"""
+Numba-accelerated payload encoding kernel.
+
+Compiles the structure-of-arrays reading encoder to native code for
+high-rate clients where Python-level packing dominates. Importing this
+module requires numba; protocol.py guards the import and falls back to
+the numpy structured-view encoder when numba is unavailable.
+"""
+
+import numpy
+from numba import njit
+
+
+@njit(cache=True)
+def encode_readings(types, values, out):
+    """
+    Write count byte and big-endian readings into a payload buffer.
+
+    Produces the same bytes as the '!B' + 'Bf'*n wire layout: one type
+    byte followed by the IEEE 754 single-precision value in network
+    byte order, repeated per reading. The float bits are extracted via
+    a uint32 view and emitted byte by byte, so no struct machinery runs
+    inside the loop.
+
+    Args:
+        types: Sensor type codes (uint8 ndarray, n entries)
+        values: Reading values (float ndarray, same length)
+        out: Target buffer of at least 1 + n*5 bytes (uint8 ndarray)
+    """
+    n = types.shape[0]
+    out[0] = n
+
+    scratch = numpy.empty(1, dtype=numpy.float32)
+    for i in range(n):
+        base = 1 + 5 * i
+        out[base] = types[i]
+
+        scratch[0] = values[i]
+        bits = scratch.view(numpy.uint32)[0]
+        out[base + 1] = (bits >> 24) & 0xFF
+        out[base + 2] = (bits >> 16) & 0xFF
+        out[base + 3] = (bits >> 8) & 0xFF
+        out[base + 4] = bits & 0xFF
@@ -0,0 +1,67 @@
+"""
+Numba-accelerated per-packet state kernel.
+
+Compiles the duplicate-check and gap-detection integer logic to native
+code for high-rate collectors where per-packet Python arithmetic
+dominates. Importing this module requires numba; server.py guards the
+import and falls back to the interpreted pipeline when numba is
+unavailable.
+"""
+
+import numpy
+from numba import njit
+
+
+@njit(cache=True)
+def process_packet(seq, last_seq, seen_head, seen_bits):
+    """
+    Run the duplicate/gap checks for one packet against typed state.
+
+    Semantically identical to CollectorServer.check_duplicate followed
+    by detect_gap: the sequence number is tested against (and marked in)
+    the device's 64K sliding bitset, and for new packets the gap to the
+    expected next sequence is computed. The window slides with seen_head
+    exactly as in the interpreted path — bit positions that re-enter the
+    window when the head advances are cleared before use, so monotonic
+    counters passing 64K never misread stale bits as duplicates.
+    Duplicates leave last_seq and the gap state untouched.
+
+    Args:
+        seq: Sequence number of the packet
+        last_seq: Device's last accepted sequence (-1 before any packet)
+        seen_head: Highest sequence marked in seen_bits (-1 initially)
+        seen_bits: Device's sliding-window bitset (uint8 ndarray, mutated)
+
+    Returns:
+        (is_duplicate, gap_size, new_last_seq, new_seen_head) tuple
+    """
+    window_bits = seen_bits.shape[0] * 8
+
+    if seq > seen_head:
+        # A new high sequence cannot be a duplicate. Slide the window
+        # up to it, clearing the positions that wrapped in.
+        if seq - seen_head >= window_bits:
+            for i in range(seen_bits.shape[0]):
+                seen_bits[i] = 0
+        else:
+            for s in range(seen_head + 1, seq):
+                seen_bits[(s & 0xFFFF) >> 3] &= numpy.uint8(
+                    0xFF ^ (1 << (s & 0x7)))
+        seen_bits[(seq & 0xFFFF) >> 3] |= numpy.uint8(1 << (seq & 0x7))
+        seen_head = seq
+    else:
+        byte = (seq & 0xFFFF) >> 3
+        mask = numpy.uint8(1 << (seq & 0x7))
+
+        if seen_bits[byte] & mask:
+            return True, 0, last_seq, seen_head
+
+        seen_bits[byte] |= mask
+
+    gap_size = 0
+    if last_seq >= 0:
+        expected = last_seq + 1
+        if seq > expected:
+            gap_size = seq - expected
+
+    return False, gap_size, seq, seen_head
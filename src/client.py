@@ -5,20 +5,121 @@ This module implements the SensorClient that simulates IoT sensors and transmits
 telemetry data to a collector server.
 """
 
+import collections
+import ctypes
+import queue
 import socket
+import struct
+import threading
 import time
-import random
-import signal
 import sys
 from typing import List, Optional
 from dataclasses import dataclass
 
 from .protocol import (
-    VERSION, MSG_TYPE_DATA, MSG_TYPE_HEARTBEAT,
+    VERSION, MSG_TYPE_DATA, MSG_TYPE_HEARTBEAT, HEADER_SIZE, HEADER_STRUCT,
+    MAX_BATCH_SIZE, MAX_PAYLOAD_SIZE, READING_SIZE,
     SENSOR_TYPE_TEMPERATURE, SENSOR_TYPE_HUMIDITY, SENSOR_TYPE_VOLTAGE,
-    SensorReading, encode_header, encode_data_payload
+    SensorReading, encode_header, encode_data_payload,
+    encode_data_payload_soa
 )
 
+# Mutable tail of the DATA header: sequence number + timestamp at
+# offset 4. The leading version/type/device bytes never change within
+# a client, so each send re-packs only these 8 bytes
+_HEADER_TAIL = struct.Struct('!II')
+
+# Batched sends: sendmmsg(2) submits a whole queue of datagrams in one
+# syscall instead of paying kernel-entry cost per packet. The socket
+# module exposes sendmsg but not sendmmsg, so the libc symbol is bound
+# via ctypes; on platforms without it the client falls back to a plain
+# sendto loop. Windows has no libc to bind at all (CDLL(None) raises
+# TypeError there), so the probe is skipped outright.
+if sys.platform != 'win32':
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _sendmmsg = _libc.sendmmsg
+    except (OSError, AttributeError):
+        _sendmmsg = None
+else:
+    _sendmmsg = None
+
+# Largest number of queued packets submitted per sendmmsg call
+_SENDMMSG_VLEN = 64
+
+# scatter-gather send is POSIX-only; Windows sockets have no sendmsg,
+# so the flush loop concatenates and uses plain send there
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+# UDP generalized segmentation offload (Linux >= 4.18): one sendmsg
+# carries several equal-size datagrams and the kernel splits them at
+# the given boundary, so only one packet traverses the UDP stack.
+# Older Python builds lack the constant, so fall back to the Linux
+# option value; kernel support is probed on first use.
+if sys.platform == 'linux':
+    _UDP_SEGMENT = getattr(socket, 'UDP_SEGMENT', 103)
+else:
+    _UDP_SEGMENT = None
+
+# Simulated value range per sensor type
+_SENSOR_RANGES = {
+    SENSOR_TYPE_TEMPERATURE: (15.0, 30.0),  # °C
+    SENSOR_TYPE_HUMIDITY: (30.0, 80.0),     # %
+    SENSOR_TYPE_VOLTAGE: (3.0, 5.0),        # V
+}
+
+# Ticks' worth of random values drawn per vectorized RNG refill
+_RNG_BUFFER_TICKS = 256
+
+# Optional vectorized RNG (numpy). Deferred to first use so clients on
+# machines without numpy never pay an import attempt per reading.
+numpy = None
+_numpy_checked = False
+
+
+def _load_numpy():
+    """Import numpy for the buffered RNG path on first use."""
+    global numpy, _numpy_checked
+
+    if _numpy_checked:
+        return numpy
+
+    _numpy_checked = True
+
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    numpy = np
+    return numpy
+
+
+class _Iovec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+
+class _Msghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_Iovec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _Mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _Msghdr),
+        ('msg_len', ctypes.c_uint32),
+    ]
+
 
 class SensorClient:
     """
@@ -54,15 +155,235 @@ class SensorClient:
         
         # Initialize UDP socket
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        
+
+        # Deep send buffer so a sendmmsg burst lands in the kernel queue
+        # instead of blocking or dropping (the kernel may cap the value)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF,
+                               4 * 1024 * 1024)
+
+        # Strict path-MTU discovery (Linux): oversized packets fail with
+        # EMSGSIZE instead of taking the silent IP-fragmentation slow path
+        if hasattr(socket, 'IP_MTU_DISCOVER'):
+            self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MTU_DISCOVER,
+                                   socket.IP_PMTUDISC_DO)
+
+        # Resolve the server address once and connect the socket: sends
+        # then use send() with no per-call address argument, and the
+        # kernel skips the destination lookup it does for each sendto
+        self._server_addr = socket.getaddrinfo(
+            server_host, server_port, socket.AF_INET, socket.SOCK_DGRAM
+        )[0][4]
+        self.socket.connect(self._server_addr)
+
+        # Outgoing packet queue, flushed in one sendmmsg per tick
+        self._pending_packets = []
+
+        # GSO availability; cleared on the first EINVAL from a kernel
+        # without UDP segmentation support
+        self._gso_ok = _UDP_SEGMENT is not None
+
+        # Reusable transmit scratch for the sendmmsg path: each queued
+        # packet is copied into a fixed MAX_PAYLOAD_SIZE slot of one
+        # long-lived buffer, and the iovec/mmsghdr arrays pointing at
+        # those slots are built once, so a flush allocates nothing
+        # regardless of queue depth
+        if _sendmmsg is not None:
+            self._tx_buf = bytearray(_SENDMMSG_VLEN * MAX_PAYLOAD_SIZE)
+            self._tx_mv = memoryview(self._tx_buf)
+            self._tx_c = (ctypes.c_char * len(self._tx_buf)) \
+                .from_buffer(self._tx_buf)
+            base = ctypes.addressof(self._tx_c)
+            self._tx_iovecs = (_Iovec * _SENDMMSG_VLEN)()
+            self._tx_msgs = (_Mmsghdr * _SENDMMSG_VLEN)()
+            for i in range(_SENDMMSG_VLEN):
+                self._tx_iovecs[i].iov_base = base + i * MAX_PAYLOAD_SIZE
+                self._tx_msgs[i].msg_hdr.msg_iov = \
+                    ctypes.pointer(self._tx_iovecs[i])
+                self._tx_msgs[i].msg_hdr.msg_iovlen = 1
+
+        # DATA header prototype: constant fields packed once; sends
+        # overwrite only the seq/timestamp tail and snapshot the result
+        self._header_buf = bytearray(HEADER_SIZE)
+        HEADER_STRUCT.pack_into(self._header_buf, 0, VERSION, MSG_TYPE_DATA,
+                                device_id, 0, 0)
+
+        # Readings per packet is fixed at runtime (sensor count when
+        # unbatched, batch_size otherwise), so specialize one struct for
+        # the whole packet: header, count and readings pack in a single
+        # C call with no header/payload assembly. Off-size packets (the
+        # final partial batch) take the generic path.
+        self._packet_n = len(self.sensor_types) if batch_size == 1 \
+            else batch_size
+        self._packet_pack = struct.Struct(
+            '!BBHIIB' + 'Bf' * self._packet_n
+        ).pack if self._packet_n <= MAX_BATCH_SIZE else None
+
+        # Per-sensor value ranges resolved once, in sensor_types order,
+        # so generating a tick's readings never walks a dispatch ladder
+        self._ranges = [_SENSOR_RANGES[st] for st in self.sensor_types]
+
+        # Buffered RNG state: with numpy, values for _RNG_BUFFER_TICKS
+        # ticks are drawn in one vectorized call and handed out row by
+        # row; without it, generate_reading falls back to random.uniform
+        self._rng = None
+        self._rng_buffer = None
+        self._rng_row = 0
+
+        # Per-packet log lines go through a background thread so the
+        # send path never blocks on the stdout lock or a write syscall
+        self._log_q = queue.SimpleQueue()
+        self._log_thread = threading.Thread(target=self._log_worker,
+                                            daemon=True)
+        self._log_thread.start()
+
+        # Cached coarse timestamp: the protocol carries whole seconds,
+        # so the wall clock is only re-read when the integer second can
+        # actually have changed. The refresh deadline is the monotonic
+        # time of the next wall-second boundary, not a fixed interval
+        # after the last refresh, so 1 Hz senders see every second
+        # exactly once instead of duplicating one and skipping the next.
+        now = time.time()
+        self._cached_ts = int(now)
+        self._next_ts_refresh = time.monotonic() + (1.0 - (now % 1.0))
+
         # Initialize state
         self.sequence_number = 0
-        self.reading_buffer = []
+        self.reading_buffer = collections.deque()
         
         # Track start time
         self.start_time = None
         self.running = True
 
+    def _log(self, message: str) -> None:
+        """Queue a log line for the background writer thread."""
+        self._log_q.put(message)
+
+    def _log_worker(self) -> None:
+        """
+        Drain queued log lines to stdout.
+
+        Runs as a daemon thread: blocking on the queue and on the write
+        syscall happens here instead of on the send path. A None
+        sentinel (posted during shutdown) stops the worker.
+        """
+        out = sys.stdout
+        while True:
+            message = self._log_q.get()
+            if message is None:
+                break
+            out.write(message + '\n')
+
+    def _stop_log_worker(self) -> None:
+        """Flush remaining log lines and stop the writer thread."""
+        self._log_q.put(None)
+        self._log_thread.join(timeout=2.0)
+        sys.stdout.flush()
+
+    def _enqueue_packet(self, *parts: bytes) -> None:
+        """
+        Queue a packet for transmission.
+
+        A packet is passed as its constituent buffers (header, payload)
+        and is never concatenated in Python: the kernel gathers the
+        pieces through the iovec at send time. Packets accumulate until
+        _flush_socket runs (once per interval tick) so a burst of sends
+        costs one syscall, not one per packet.
+        """
+        self._pending_packets.append(parts)
+
+        if len(self._pending_packets) >= _SENDMMSG_VLEN:
+            self._flush_socket()
+
+    def _flush_socket(self) -> None:
+        """
+        Transmit all queued packets.
+
+        Uses a single sendmmsg(2) syscall where libc provides it; falls
+        back to a sendto loop elsewhere.
+        """
+        if not self._pending_packets:
+            return
+
+        packets = self._pending_packets
+        self._pending_packets = []
+
+        if self._gso_ok and len(packets) > 1:
+            # Equal-size runs can ride a single GSO send: the kernel
+            # splits the joined buffer back into datagrams at size
+            # boundaries. Mixed-size queues fall through to sendmmsg.
+            size = sum(len(part) for part in packets[0])
+            if (all(sum(len(part) for part in parts) == size
+                    for parts in packets[1:])
+                    and len(packets) * size <= 65507):
+                try:
+                    self.socket.sendmsg(
+                        [part for parts in packets for part in parts],
+                        [(socket.IPPROTO_UDP, _UDP_SEGMENT,
+                          struct.pack('@H', size))]
+                    )
+                    return
+                except OSError:
+                    # Kernel predates UDP GSO: disable and fall through
+                    self._gso_ok = False
+
+        if _sendmmsg is not None:
+            self._send_batch_mmsg(packets)
+        elif _HAS_SENDMSG:
+            for parts in packets:
+                # sendmsg gathers the pieces; no concatenation needed
+                self.socket.sendmsg(parts)
+        else:
+            # Windows: no sendmsg, so join the pieces and use plain
+            # send on the connected socket
+            for parts in packets:
+                self.socket.send(b''.join(parts))
+
+    def _send_batch_mmsg(self, packets: List[tuple]) -> None:
+        """
+        Submit packets to the kernel via one sendmmsg call.
+
+        Each packet is a tuple of buffers (header, payload); its pieces
+        land back to back in the packet's scratch slot, so the flush
+        reuses the same buffer and iovec/mmsghdr arrays every time
+        instead of allocating per call.
+        """
+        n = len(packets)
+
+        # Copy each packet's pieces into its slot of the preallocated
+        # scratch; the pre-built iovecs already point there, so only
+        # the lengths need updating (msg_name stays NULL: the socket is
+        # connected, so the kernel already knows the destination)
+        mv = self._tx_mv
+        iovecs = self._tx_iovecs
+        for i, parts in enumerate(packets):
+            start = i * MAX_PAYLOAD_SIZE
+            offset = start
+            for part in parts:
+                end = offset + len(part)
+                mv[offset:end] = part
+                offset = end
+            iovecs[i].iov_len = offset - start
+
+        fd = self.socket.fileno()
+        msgs = self._tx_msgs
+        sent = 0
+
+        while sent < n:
+            result = _sendmmsg(
+                fd,
+                ctypes.byref(msgs, sent * ctypes.sizeof(_Mmsghdr)),
+                n - sent,
+                0
+            )
+
+            if result <= 0:
+                # Unexpected failure: push the remainder the portable way
+                for parts in packets[sent:]:
+                    self.socket.sendmsg(parts)
+                return
+
+            sent += result
+
     def generate_reading(self, sensor_type: int) -> SensorReading:
         """
         Generate a simulated sensor reading.
@@ -73,6 +394,8 @@ class SensorClient:
         Returns:
             SensorReading object with random value in appropriate range
         """
+        import random
+
         if sensor_type == SENSOR_TYPE_TEMPERATURE:
             # Temperature: 15-30°C
             value = random.uniform(15.0, 30.0)
@@ -94,7 +417,99 @@ class SensorClient:
         Returns:
             List of SensorReading objects
         """
-        return [self.generate_reading(st) for st in self.sensor_types]
+        if _load_numpy() is not None:
+            return self._generate_readings_buffered()
+
+        # Stdlib fallback: pre-resolved ranges plus locally bound
+        # uniform/SensorReading keep the per-reading work to one RNG
+        # call and one dataclass construction
+        import random
+        uniform = random.uniform
+        reading = SensorReading
+        return [reading(st, uniform(lo, hi))
+                for st, (lo, hi) in zip(self.sensor_types, self._ranges)]
+
+    def _next_rng_row(self):
+        """
+        Pop one tick's row of values from the pre-filled RNG buffer.
+
+        The buffer holds _RNG_BUFFER_TICKS rows of uniform values, drawn
+        in a single vectorized call; refills amortize RNG cost to one
+        numpy call per 256 ticks instead of one random.uniform per
+        reading.
+        """
+        if self._rng_buffer is None or self._rng_row >= _RNG_BUFFER_TICKS:
+            if self._rng is None:
+                self._rng = numpy.random.default_rng()
+                ranges = [_SENSOR_RANGES[st] for st in self.sensor_types]
+                self._rng_lo = numpy.array([lo for lo, _ in ranges])
+                self._rng_hi = numpy.array([hi for _, hi in ranges])
+                self._types_arr = numpy.array(self.sensor_types,
+                                              dtype=numpy.uint8)
+
+            self._rng_buffer = self._rng.uniform(
+                self._rng_lo, self._rng_hi,
+                size=(_RNG_BUFFER_TICKS, len(self.sensor_types))
+            )
+            self._rng_row = 0
+
+        row = self._rng_buffer[self._rng_row]
+        self._rng_row += 1
+        return row
+
+    def _generate_readings_buffered(self) -> List[SensorReading]:
+        """Wrap one RNG buffer row into SensorReading objects."""
+        row = self._next_rng_row()
+        return [SensorReading(sensor_type=st, value=float(v))
+                for st, v in zip(self.sensor_types, row)]
+
+    def _now_epoch(self) -> int:
+        """
+        Current Unix time in whole seconds, from the coarse cache.
+
+        Refreshes from time.time() only once the monotonic clock passes
+        the next wall-second boundary, so the emitted integer second
+        tracks the wall clock exactly while still costing one clock
+        call per send on the fast path.
+        """
+        if time.monotonic() >= self._next_ts_refresh:
+            now = time.time()
+            self._cached_ts = int(now)
+            self._next_ts_refresh = time.monotonic() + (1.0 - (now % 1.0))
+        return self._cached_ts
+
+    def _data_header(self, timestamp: int) -> bytes:
+        """
+        Build the DATA header for the current sequence number.
+
+        Re-packs only the 8-byte seq/timestamp tail into the prototype
+        buffer; the result is snapshot with bytes() because queued
+        packets outlive the next tick's overwrite.
+        """
+        _HEADER_TAIL.pack_into(self._header_buf, 4,
+                               self.sequence_number, timestamp)
+        return bytes(self._header_buf)
+
+    def _send_tick_soa(self) -> None:
+        """
+        Generate and send one tick's readings straight from arrays.
+
+        Structure-of-arrays fast path for the non-batched case: the RNG
+        buffer row feeds encode_data_payload_soa directly, skipping the
+        per-reading SensorReading allocations and attribute lookups.
+        """
+        row = self._next_rng_row()
+        timestamp = self._now_epoch()
+
+        header = self._data_header(timestamp)
+        payload = encode_data_payload_soa(self._types_arr, row)
+
+        self._enqueue_packet(header, payload)
+
+        self._log(f"[DATA] seq={self.sequence_number}, timestamp={timestamp}, "
+                  f"readings={len(row)}, bytes={len(header) + len(payload)}")
+
+        self.sequence_number += 1
 
     def send_data(self, readings: List[SensorReading]) -> None:
         """
@@ -104,29 +519,32 @@ class SensorClient:
             readings: List of SensorReading objects to send
         """
         # Get current timestamp
-        timestamp = int(time.time())
-        
-        # Encode header
-        header = encode_header(
-            VERSION,
-            MSG_TYPE_DATA,
-            self.device_id,
-            self.sequence_number,
-            timestamp
-        )
-        
-        # Encode payload
-        payload = encode_data_payload(readings)
-        
-        # Combine header and payload
-        packet = header + payload
-        
-        # Send via UDP
-        self.socket.sendto(packet, (self.server_host, self.server_port))
-        
-        # Log sent packet
-        print(f"[DATA] seq={self.sequence_number}, timestamp={timestamp}, "
-              f"readings={len(readings)}, bytes={len(packet)}")
+        timestamp = self._now_epoch()
+
+        if self._packet_pack is not None and len(readings) == self._packet_n:
+            # Specialized fast path: the pre-compiled fixed-N struct
+            # packs the entire packet in one call
+            flat = []
+            for reading in readings:
+                flat.append(reading.sensor_type)
+                flat.append(reading.value)
+            self._enqueue_packet(self._packet_pack(
+                VERSION, MSG_TYPE_DATA, self.device_id,
+                self.sequence_number, timestamp, self._packet_n, *flat
+            ))
+            nbytes = HEADER_SIZE + 1 + self._packet_n * READING_SIZE
+        else:
+            # Generic path: header from the prototype, payload encoded
+            # for whatever reading count this packet carries; the kernel
+            # gathers the two buffers at send time
+            header = self._data_header(timestamp)
+            payload = encode_data_payload(readings)
+            self._enqueue_packet(header, payload)
+            nbytes = len(header) + len(payload)
+
+        # Log sent packet off-thread
+        self._log(f"[DATA] seq={self.sequence_number}, timestamp={timestamp}, "
+                  f"readings={len(readings)}, bytes={nbytes}")
         
         # Increment sequence number
         self.sequence_number += 1
@@ -136,7 +554,7 @@ class SensorClient:
         Send HEARTBEAT message (no payload).
         """
         # Get current timestamp
-        timestamp = int(time.time())
+        timestamp = self._now_epoch()
         
         # Encode header (no payload for heartbeat)
         packet = encode_header(
@@ -147,11 +565,11 @@ class SensorClient:
             timestamp
         )
         
-        # Send via UDP
-        self.socket.sendto(packet, (self.server_host, self.server_port))
-        
-        # Log sent heartbeat
-        print(f"[HEARTBEAT] seq={self.sequence_number}, timestamp={timestamp}")
+        # Queue for the per-tick batched flush
+        self._enqueue_packet(packet)
+
+        # Log sent heartbeat off-thread
+        self._log(f"[HEARTBEAT] seq={self.sequence_number}, timestamp={timestamp}")
         
         # Increment sequence number
         self.sequence_number += 1
@@ -173,21 +591,22 @@ class SensorClient:
         """
         # Accumulate readings in buffer
         self.reading_buffer.extend(readings)
-        
-        # Check if we've accumulated enough readings to send a batch
-        if len(self.reading_buffer) >= self.batch_size:
-            # Send exactly batch_size readings
-            self.send_data(self.reading_buffer[:self.batch_size])
-            # Keep any extra readings in buffer for next batch
-            self.reading_buffer = self.reading_buffer[self.batch_size:]
+
+        # Drain full batches from the left; popleft is O(1) per reading
+        # where the old list slicing copied the whole buffer each time
+        popleft = self.reading_buffer.popleft
+        while len(self.reading_buffer) >= self.batch_size:
+            self.send_data([popleft() for _ in range(self.batch_size)])
     
     def flush_batch(self) -> None:
         """
         Flush any remaining readings in the batch buffer.
         """
         if self.reading_buffer:
-            self.send_data(self.reading_buffer)
-            self.reading_buffer = []
+            self.send_data(list(self.reading_buffer))
+            self.reading_buffer.clear()
+
+        self._flush_socket()
 
     def _signal_handler(self, signum, frame):
         """Handle Ctrl+C gracefully."""
@@ -198,8 +617,22 @@ class SensorClient:
         """
         Main client loop: generate and send telemetry data.
         """
-        # Set up signal handler for graceful shutdown
+        # Set up signal handler for graceful shutdown (imported here so
+        # merely importing the module stays cheap)
+        import selectors
+        import signal
         signal.signal(signal.SIGINT, self._signal_handler)
+
+        # Idle waits happen in a selector watching a wakeup pipe that
+        # the interpreter writes to on signal delivery: the wait ends
+        # exactly at the next send deadline or the instant a signal
+        # lands, instead of a sleep that resumes after the handler
+        wakeup_r, wakeup_w = socket.socketpair()
+        wakeup_r.setblocking(False)
+        wakeup_w.setblocking(False)
+        old_wakeup_fd = signal.set_wakeup_fd(wakeup_w.fileno())
+        selector = selectors.DefaultSelector()
+        selector.register(wakeup_r, selectors.EVENT_READ)
         
         print(f"[INFO] Starting sensor client (device_id={self.device_id})")
         print(f"[INFO] Server: {self.server_host}:{self.server_port}")
@@ -207,47 +640,81 @@ class SensorClient:
         print(f"[INFO] Sensor types: {self.sensor_types}")
         
         self.start_time = time.time()
-        next_send_time = self.start_time
-        
+
+        # Drift-corrected schedule on the monotonic clock: deadlines are
+        # immune to NTP wall-clock jumps, advance in exact interval
+        # steps, and the loop sleeps precisely until the next one
+        # instead of waking every 100 ms to poll
+        mono_start = time.monotonic()
+        deadline = mono_start + self.duration
+        next_send_time = mono_start
+
         try:
             while self.running:
-                current_time = time.time()
-                elapsed = current_time - self.start_time
-                
+                now = time.monotonic()
+
                 # Check if duration expired
-                if elapsed >= self.duration:
-                    print(f"[INFO] Duration {self.duration}s reached, stopping...")
+                if now >= deadline:
+                    self._log(f"[INFO] Duration {self.duration}s reached, stopping...")
                     break
-                
+
                 # Check if it's time to send
-                if current_time >= next_send_time:
-                    # Generate readings
-                    readings = self.generate_readings()
-                    
-                    # Handle batching
-                    if self.batch_size == 1:
-                        # Non-batched mode: send immediately
-                        self.send_data(readings)
+                if now >= next_send_time:
+                    if self.batch_size == 1 and _load_numpy() is not None:
+                        # Non-batched mode with numpy: readings flow from
+                        # the RNG buffer into the payload as arrays
+                        self._send_tick_soa()
                     else:
-                        # Batched mode: add to buffer
-                        self.add_to_batch(readings)
+                        # Generate readings
+                        readings = self.generate_readings()
+
+                        if self.batch_size == 1:
+                            # Non-batched mode: send immediately
+                            self.send_data(readings)
+                        else:
+                            # Batched mode: add to buffer
+                            self.add_to_batch(readings)
                     
-                    # Schedule next send
-                    next_send_time += self.interval
-                
-                # Sleep briefly to avoid busy waiting
-                time.sleep(0.1)
+                    # Flush the tick's packets in one syscall
+                    self._flush_socket()
+
+                    # Schedule next send; if the tick slipped past one or
+                    # more deadlines, step forward without accumulating drift
+                    while next_send_time <= now:
+                        next_send_time += self.interval
+                else:
+                    # Wait until the next send or the duration deadline,
+                    # whichever comes first; a signal wakes the selector
+                    # immediately via the wakeup pipe
+                    if selector.select(max(0.0, min(next_send_time,
+                                                    deadline) - now)):
+                        try:
+                            wakeup_r.recv(64)
+                        except BlockingIOError:
+                            pass
             
             # Flush any remaining batched readings
             if self.batch_size > 1:
                 self.flush_batch()
             
-            print(f"[INFO] Client stopped. Total packets sent: {self.sequence_number}")
+            # Queued so it lands after any not-yet-drained packet lines
+            self._log(f"[INFO] Client stopped. Total packets sent: {self.sequence_number}")
             
         except Exception as e:
             print(f"[ERROR] Client error: {e}")
             raise
         finally:
+            # Drain anything still queued before closing (ignore socket
+            # errors here so they can't mask an exception from the loop)
+            try:
+                self._flush_socket()
+            except OSError:
+                pass
+            self._stop_log_worker()
+            signal.set_wakeup_fd(old_wakeup_fd)
+            selector.close()
+            wakeup_r.close()
+            wakeup_w.close()
             self.socket.close()
 
 
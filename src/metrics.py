@@ -6,6 +6,7 @@ for telemetry protocol performance evaluation.
 """
 
 import csv
+import functools
 import time
 import json
 import statistics
@@ -13,6 +14,59 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+try:
+    import orjson  # Rust-backed JSON, ~5x faster serialization than stdlib
+except ImportError:
+    orjson = None
+
+# Optional JIT-compiled statistics kernel (numba + numpy). The pure-Python
+# implementation remains the fallback when neither is installed.
+#
+# Importing and warming up numba costs on the order of a second, which
+# would be paid by every fresh process that imports this module (each
+# test script invocation spawns new processes). The import and compile
+# are therefore deferred until a value list is large enough to amortize
+# them; cache=True persists the compiled kernel on disk so later
+# processes only pay the cache load, not a recompile.
+_JIT_MIN_SIZE = 1024  # below this the stdlib path is faster than JIT dispatch
+
+numpy = None
+_min_median_max = None
+_jit_checked = False
+
+
+def _load_stats_kernel():
+    """Import and compile the numba statistics kernel on first use."""
+    global numpy, _min_median_max, _jit_checked
+
+    if _jit_checked:
+        return _min_median_max
+
+    _jit_checked = True
+
+    try:
+        import numpy as np
+        import numba
+    except ImportError:
+        return None
+
+    numpy = np
+
+    @numba.njit(cache=True)
+    def kernel(values):
+        vmin = values[0]
+        vmax = values[0]
+        for i in range(1, values.shape[0]):
+            v = values[i]
+            if v < vmin:
+                vmin = v
+            if v > vmax:
+                vmax = v
+        return vmin, np.median(values), vmax
+
+    _min_median_max = kernel
+    return _min_median_max
+
 try:
     from .protocol import HEADER_SIZE, READING_SIZE
 except ImportError:
@@ -60,99 +114,200 @@ class MetricsCalculator:
             ValueError: If CSV file is malformed or empty
         """
         csv_path = Path(csv_file)
-        
-        if not csv_path.exists():
-            raise FileNotFoundError(f"CSV file not found: {csv_file}")
-        
-        # Initialize counters
+
+        # Memoize on (path, mtime, size) so repeated analysis of the same
+        # unchanged log file within one session skips the re-parse. The
+        # stat call doubles as the existence check (one syscall, not two).
+        try:
+            stat = csv_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {csv_file}") from None
+
+        return _calculate_from_csv_cached(str(csv_path), stat.st_mtime_ns,
+                                          stat.st_size)
+
+    def calculate_and_verify(self, csv_file: str,
+                             device_id: int) -> tuple:
+        """
+        Calculate metrics and check sequence order in one CSV pass.
+
+        Fuses calculate_from_csv with the baseline test's per-device
+        sequence-order check: the metric counters, byte totals, and the
+        monotonicity check all share a single row iteration, so the log
+        file is read and parsed once instead of three times.
+
+        Args:
+            csv_file: Path to CSV log file generated by CollectorServer
+            device_id: Device whose sequence numbers must be monotonic
+
+        Returns:
+            Tuple of (MetricsResult, sequence_in_order)
+
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+            ValueError: If CSV file is malformed or empty
+        """
         total_packets = 0
         duplicate_count = 0
         non_duplicate_count = 0
         total_readings = 0
         total_gap_count = 0
-        
-        # Read CSV file
-        with open(csv_path, 'r') as f:
+        total_bytes = 0
+
+        prev_seq = None
+        sequence_in_order = True
+
+        with open(csv_file, 'r') as f:
             reader = csv.DictReader(f)
-            
+
             for row in reader:
                 total_packets += 1
-                
-                # Parse duplicate flag
+
                 is_duplicate = row['duplicate_flag'].lower() == 'true'
-                
+
                 if is_duplicate:
                     duplicate_count += 1
                 else:
                     non_duplicate_count += 1
-                    
-                    # Count readings (only for non-duplicates)
+
                     reading_count = int(row['reading_count'])
                     total_readings += reading_count
-                
-                # Sum gap counts
-                gap_size = int(row['gap_size'])
-                total_gap_count += gap_size
-        
+
+                    # Accumulate packet bytes in the same pass (the
+                    # separate bytes loop in calculate_from_csv re-read
+                    # the whole file)
+                    if reading_count > 0:  # DATA message
+                        total_bytes += HEADER_SIZE + 1 + (reading_count * READING_SIZE)
+                    else:  # HEARTBEAT message
+                        total_bytes += HEADER_SIZE
+
+                    # Track sequence monotonicity for the target device
+                    if int(row['device_id']) == device_id:
+                        seq = int(row['seq'])
+                        if prev_seq is not None and seq <= prev_seq:
+                            sequence_in_order = False
+                        prev_seq = seq
+
+                total_gap_count += int(row['gap_size'])
+
         if total_packets == 0:
             raise ValueError("CSV file contains no data packets")
-        
-        # Calculate duplicate rate
-        duplicate_rate = duplicate_count / total_packets if total_packets > 0 else 0.0
-        
-        # Calculate bytes_per_report metric
-        # This metric measures bandwidth efficiency by calculating the average
-        # number of bytes required to transmit one sensor reading.
-        # 
-        # Formula: bytes_per_report = total_bytes / total_readings
-        # 
-        # Packet structure:
-        # - Header: 12 bytes (fixed)
-        # - Count: 1 byte (for DATA messages)
-        # - Readings: 5 bytes each (sensor_type + float value)
-        # 
-        # Examples:
-        # - Non-batched (1 reading/packet): (12 + 1 + 5) / 1 = 18 bytes per reading
-        # - Batched (10 readings/packet): (12 + 1 + 50) / 10 = 6.3 bytes per reading
-        # - Maximum batch (37 readings): (12 + 1 + 185) / 37 = 5.35 bytes per reading
-        #
-        # Lower values indicate better bandwidth efficiency.
-        if total_readings > 0:
-            # Calculate total bytes sent for non-duplicate packets
-            # We only count non-duplicates to avoid inflating the metric
-            total_bytes = 0
-            
-            # Re-read CSV to calculate total bytes
-            with open(csv_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    is_duplicate = row['duplicate_flag'].lower() == 'true'
-                    if not is_duplicate:
-                        reading_count = int(row['reading_count'])
-                        if reading_count > 0:  # DATA message
-                            # DATA packet: header + count byte + readings
-                            packet_size = HEADER_SIZE + 1 + (reading_count * READING_SIZE)
-                        else:  # HEARTBEAT message
-                            # HEARTBEAT packet: header only (no readings to count)
-                            packet_size = HEADER_SIZE
-                        total_bytes += packet_size
-            
-            # Calculate average bytes per reading
-            bytes_per_report = total_bytes / total_readings if total_readings > 0 else 0.0
-        else:
-            # Only heartbeats, no readings to measure
-            bytes_per_report = 0.0
-        
-        # Create result
+
+        duplicate_rate = duplicate_count / total_packets
+        bytes_per_report = (total_bytes / total_readings
+                            if total_readings > 0 else 0.0)
+
         result = MetricsResult(
             bytes_per_report=bytes_per_report,
             packets_received=non_duplicate_count,
-            packets_sent=total_packets + total_gap_count,  # Received + missing
+            packets_sent=total_packets + total_gap_count,
             duplicate_rate=duplicate_rate,
             sequence_gap_count=total_gap_count
         )
+
+        return result, sequence_in_order
+
+
+@functools.lru_cache(maxsize=128)
+def _calculate_from_csv_cached(csv_file: str, mtime_ns: int,
+                               size: int) -> MetricsResult:
+    """
+    Parse a CSV log file and calculate metrics (cached implementation).
+
+    The mtime_ns/size arguments exist only to key the cache: a rewritten
+    log file gets a fresh parse, an unchanged one is served from memory.
+    """
+    csv_path = Path(csv_file)
+
+    # Initialize counters
+    total_packets = 0
+    duplicate_count = 0
+    non_duplicate_count = 0
+    total_readings = 0
+    total_gap_count = 0
+    
+    # Read CSV file
+    with open(csv_path, 'r') as f:
+        reader = csv.DictReader(f)
         
-        return result
+        for row in reader:
+            total_packets += 1
+            
+            # Parse duplicate flag
+            is_duplicate = row['duplicate_flag'].lower() == 'true'
+            
+            if is_duplicate:
+                duplicate_count += 1
+            else:
+                non_duplicate_count += 1
+                
+                # Count readings (only for non-duplicates)
+                reading_count = int(row['reading_count'])
+                total_readings += reading_count
+            
+            # Sum gap counts
+            gap_size = int(row['gap_size'])
+            total_gap_count += gap_size
+    
+    if total_packets == 0:
+        raise ValueError("CSV file contains no data packets")
+    
+    # Calculate duplicate rate
+    duplicate_rate = duplicate_count / total_packets if total_packets > 0 else 0.0
+    
+    # Calculate bytes_per_report metric
+    # This metric measures bandwidth efficiency by calculating the average
+    # number of bytes required to transmit one sensor reading.
+    # 
+    # Formula: bytes_per_report = total_bytes / total_readings
+    # 
+    # Packet structure:
+    # - Header: 12 bytes (fixed)
+    # - Count: 1 byte (for DATA messages)
+    # - Readings: 5 bytes each (sensor_type + float value)
+    # 
+    # Examples:
+    # - Non-batched (1 reading/packet): (12 + 1 + 5) / 1 = 18 bytes per reading
+    # - Batched (10 readings/packet): (12 + 1 + 50) / 10 = 6.3 bytes per reading
+    # - Maximum batch (37 readings): (12 + 1 + 185) / 37 = 5.35 bytes per reading
+    #
+    # Lower values indicate better bandwidth efficiency.
+    if total_readings > 0:
+        # Calculate total bytes sent for non-duplicate packets
+        # We only count non-duplicates to avoid inflating the metric
+        total_bytes = 0
+        
+        # Re-read CSV to calculate total bytes
+        with open(csv_path, 'r') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                is_duplicate = row['duplicate_flag'].lower() == 'true'
+                if not is_duplicate:
+                    reading_count = int(row['reading_count'])
+                    if reading_count > 0:  # DATA message
+                        # DATA packet: header + count byte + readings
+                        packet_size = HEADER_SIZE + 1 + (reading_count * READING_SIZE)
+                    else:  # HEARTBEAT message
+                        # HEARTBEAT packet: header only (no readings to count)
+                        packet_size = HEADER_SIZE
+                    total_bytes += packet_size
+        
+        # Calculate average bytes per reading
+        bytes_per_report = total_bytes / total_readings if total_readings > 0 else 0.0
+    else:
+        # Only heartbeats, no readings to measure
+        bytes_per_report = 0.0
+    
+    # Create result
+    result = MetricsResult(
+        bytes_per_report=bytes_per_report,
+        packets_received=non_duplicate_count,
+        packets_sent=total_packets + total_gap_count,  # Received + missing
+        duplicate_rate=duplicate_rate,
+        sequence_gap_count=total_gap_count
+    )
+    
+    return result
 
 
 def measure_cpu_time(func, *args, **kwargs) -> tuple:
@@ -202,7 +357,15 @@ class StatisticalAnalyzer:
         """
         if not values:
             raise ValueError("Cannot calculate statistics on empty list")
-        
+
+        if len(values) >= _JIT_MIN_SIZE:
+            kernel = _load_stats_kernel()
+            if kernel is not None:
+                vmin, vmed, vmax = kernel(
+                    numpy.asarray(values, dtype=numpy.float64))
+                return {'min': float(vmin), 'median': float(vmed),
+                        'max': float(vmax)}
+
         return {
             'min': min(values),
             'median': statistics.median(values),
@@ -240,12 +403,15 @@ def save_metrics_json(metrics_data: Dict[str, Any], output_file: str) -> None:
     }
     """
     output_path = Path(output_file)
-    
+
     # Create output directory if it doesn't exist
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Write JSON with pretty printing
-    with open(output_path, 'w') as f:
-        json.dump(metrics_data, f, indent=2)
-    
+
+    # Write JSON with pretty printing (orjson serializes in C, stdlib fallback)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(metrics_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(metrics_data, f, indent=2)
+
     print(f"Metrics saved to: {output_file}")
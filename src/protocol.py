@@ -9,6 +9,11 @@ from dataclasses import dataclass
 from typing import List
 import struct
 
+try:
+    import numpy  # Optional: enables structure-of-arrays payload encoding
+except ImportError:
+    numpy = None
+
 # Protocol Constants
 VERSION = 0x01  # Protocol version 1.0
 
@@ -29,6 +34,47 @@ READING_SIZE = 5  # bytes (1 byte sensor type + 4 bytes float value)
 # Maximum batch size calculation: (MAX_PAYLOAD - HEADER - 1 byte count) / READING_SIZE
 MAX_BATCH_SIZE = (MAX_PAYLOAD_SIZE - HEADER_SIZE - 1) // READING_SIZE  # 37 readings
 
+# Pre-compiled header struct: parsing the '!BBHII' format string once
+# at import time instead of on every encode/decode call
+HEADER_STRUCT = struct.Struct('!BBHII')
+
+# Pre-compiled single-reading struct for bulk payload decoding
+_READING_STRUCT = struct.Struct('!Bf')
+
+# Pre-compiled payload structs, one per batch size: a whole payload
+# packs in a single C call instead of a per-reading struct.pack loop
+# with repeated bytes concatenation
+_PAYLOAD_STRUCTS = {
+    n: struct.Struct('!B' + 'Bf' * n) for n in range(1, MAX_BATCH_SIZE + 1)
+}
+
+# Structured view matching one encoded reading: type byte + big-endian float
+if numpy is not None:
+    _READING_DTYPE = numpy.dtype([('t', 'u1'), ('v', '>f4')])
+
+# Optional native encoding kernel (numba). Deferred to first use so the
+# JIT toolchain is only imported by callers on the SoA fast path.
+_encode_kernel = None
+_encode_kernel_checked = False
+
+
+def _load_encode_kernel():
+    """Import the numba-compiled reading encoder on first use."""
+    global _encode_kernel, _encode_kernel_checked
+
+    if _encode_kernel_checked:
+        return _encode_kernel
+
+    _encode_kernel_checked = True
+
+    try:
+        from ._encode_nb import encode_readings
+    except ImportError:
+        return None
+
+    _encode_kernel = encode_readings
+    return _encode_kernel
+
 
 @dataclass
 class SensorReading:
@@ -77,8 +123,8 @@ def encode_header(version: int, msg_type: int, device_id: int,
     Returns:
         12-byte binary header
     """
-    return struct.pack('!BBHII', version, msg_type, device_id, 
-                      sequence_number, timestamp)
+    return HEADER_STRUCT.pack(version, msg_type, device_id,
+                              sequence_number, timestamp)
 
 
 def decode_header(data: bytes) -> dict:
@@ -97,9 +143,8 @@ def decode_header(data: bytes) -> dict:
     if len(data) < HEADER_SIZE:
         raise ValueError(f"Packet too short: {len(data)} bytes, expected at least {HEADER_SIZE}")
     
-    version, msg_type, device_id, sequence_number, timestamp = struct.unpack(
-        '!BBHII', data[:HEADER_SIZE]
-    )
+    version, msg_type, device_id, sequence_number, timestamp = \
+        HEADER_STRUCT.unpack_from(data)
     
     return {
         'version': version,
@@ -153,15 +198,96 @@ def encode_data_payload(readings: List[SensorReading]) -> bytes:
     if total_size > MAX_PAYLOAD_SIZE:
         raise ValueError(f"Packet too large: {total_size} bytes, max is {MAX_PAYLOAD_SIZE}")
     
-    # Encode reading count (1 byte)
-    payload = struct.pack('!B', len(readings))
-    
-    # Encode each reading (5 bytes each)
-    # Format: '!Bf' = big-endian unsigned byte + float
+    # Flatten (type, value) pairs and pack count + readings in one call
+    # using the pre-compiled struct for this batch size
+    flat = []
     for reading in readings:
-        payload += struct.pack('!Bf', reading.sensor_type, reading.value)
-    
-    return payload
+        flat.append(reading.sensor_type)
+        flat.append(reading.value)
+
+    return _PAYLOAD_STRUCTS[len(readings)].pack(len(readings), *flat)
+
+
+def encode_data_payload_soa(types, values) -> bytes:
+    """
+    Encode DATA message payload from parallel type/value arrays.
+
+    Structure-of-arrays counterpart to encode_data_payload for callers
+    that keep readings in numpy arrays instead of SensorReading objects:
+    both columns blit into the payload through a single structured-dtype
+    view, with no per-reading Python object or attribute access.
+    Produces byte-identical output to encode_data_payload.
+
+    Requires numpy; callers are expected to use this only when their
+    readings already live in arrays.
+
+    Args:
+        types: Sensor type codes (uint8 array-like, 1-37 entries)
+        values: Reading values (float array-like, same length)
+
+    Returns:
+        Encoded payload bytes (1 + N*5 bytes)
+
+    Raises:
+        ValueError: If the arrays are empty or exceed MAX_BATCH_SIZE
+    """
+    n = len(types)
+
+    if n == 0:
+        raise ValueError("DATA message must contain at least one reading")
+
+    if n > MAX_BATCH_SIZE:
+        raise ValueError(f"Too many readings: {n}, max is {MAX_BATCH_SIZE}")
+
+    buf = bytearray(1 + n * READING_SIZE)
+
+    kernel = _load_encode_kernel()
+    if kernel is not None:
+        # Native path: the JIT-compiled kernel writes count byte and
+        # big-endian readings directly into the buffer
+        kernel(types, values, numpy.frombuffer(buf, dtype=numpy.uint8))
+        return bytes(buf)
+
+    buf[0] = n
+
+    view = numpy.frombuffer(buf, dtype=_READING_DTYPE, count=n, offset=1)
+    view['t'] = types
+    view['v'] = values
+
+    return bytes(buf)
+
+
+def count_readings(data: bytes) -> int:
+    """
+    Validate a DATA payload and return its reading count without decoding.
+
+    Runs the same structural checks as decode_data_payload (count byte
+    present, count non-zero, payload long enough) but skips the
+    per-reading struct unpacking and SensorReading construction, for
+    consumers that only need to know how many readings a packet carries.
+
+    Args:
+        data: Payload bytes (after header)
+
+    Returns:
+        Number of readings in the payload
+
+    Raises:
+        ValueError: If payload is malformed
+    """
+    if len(data) < 1:
+        raise ValueError("DATA payload must contain reading count")
+
+    reading_count = data[0]
+
+    if reading_count == 0:
+        raise ValueError("DATA message must contain at least one reading")
+
+    expected_size = 1 + (reading_count * READING_SIZE)
+    if len(data) < expected_size:
+        raise ValueError(f"Payload too short: {len(data)} bytes, expected {expected_size}")
+
+    return reading_count
 
 
 def decode_data_payload(data: bytes) -> List[SensorReading]:
@@ -191,13 +317,8 @@ def decode_data_payload(data: bytes) -> List[SensorReading]:
     if len(data) < expected_size:
         raise ValueError(f"Payload too short: {len(data)} bytes, expected {expected_size}")
     
-    # Decode readings
-    readings = []
-    offset = 1
-    
-    for _ in range(reading_count):
-        sensor_type, value = struct.unpack('!Bf', data[offset:offset + READING_SIZE])
-        readings.append(SensorReading(sensor_type=sensor_type, value=value))
-        offset += READING_SIZE
-    
-    return readings
+    # Decode all readings in one C-level pass: iter_unpack walks the
+    # memoryview without allocating a bytes slice per reading
+    view = memoryview(data)[1:expected_size]
+    return [SensorReading(sensor_type=sensor_type, value=value)
+            for sensor_type, value in _READING_STRUCT.iter_unpack(view)]
@@ -5,27 +5,167 @@ This module implements the CollectorServer that receives telemetry packets,
 detects duplicates and gaps, reorders by timestamp, and logs to CSV.
 """
 
+import collections
+import ctypes
+import heapq
+import logging
+import os
+import queue
+import select
 import socket
-import csv
+import sys
+import threading
 import time
 import struct
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, Set, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+try:
+    import numpy  # Optional: enables SoA reorder-buffer columns
+except ImportError:
+    numpy = None
 
 try:
     from .protocol import (
         VERSION, MSG_TYPE_DATA, MSG_TYPE_HEARTBEAT,
-        HEADER_SIZE, MAX_PAYLOAD_SIZE,
-        decode_header, decode_data_payload
+        HEADER_SIZE, HEADER_STRUCT, MAX_PAYLOAD_SIZE,
+        count_readings
     )
 except ImportError:
     from protocol import (
         VERSION, MSG_TYPE_DATA, MSG_TYPE_HEARTBEAT,
-        HEADER_SIZE, MAX_PAYLOAD_SIZE,
-        decode_header, decode_data_payload
+        HEADER_SIZE, HEADER_STRUCT, MAX_PAYLOAD_SIZE,
+        count_readings
     )
 
+# Batched receives: recvmmsg(2) pulls a burst of datagrams per syscall
+# instead of paying kernel-entry cost per packet. The socket module has
+# no binding, so the libc symbol is bound via ctypes; platforms without
+# it fall back to one recvfrom per packet. Windows has no libc to bind
+# at all (CDLL(None) raises TypeError there), so the probe is skipped
+# outright.
+if sys.platform != 'win32':
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _recvmmsg = _libc.recvmmsg
+    except (OSError, AttributeError):
+        _recvmmsg = None
+else:
+    _recvmmsg = None
+
+# Largest number of datagrams pulled per recvmmsg call
+_RECVMMSG_VLEN = 32
+
+# Drain flag so a partially filled recvmmsg returns what is queued
+# instead of blocking for the rest of the batch
+_MSG_DONTWAIT = 0x40
+
+# Kernel receive timestamps: SO_TIMESTAMPNS makes the kernel attach
+# each datagram's CLOCK_REALTIME arrival time as a control message, so
+# per-packet arrival times cost no userspace clock calls. Linux option
+# value (the socket module has no constant); probed at startup.
+_SO_TIMESTAMPNS = 35
+_SCM_TIMESTAMPNS = _SO_TIMESTAMPNS
+
+# Per-message control buffer size: one cmsghdr plus a timespec, rounded
+# up to keep every slot 8-byte aligned
+_CMSG_SLOT = 64
+
+# Duplicate-detection window: one bit per sequence number over the
+# most recent 64K sequences (seq mod the window)
+_SEEN_WINDOW_BYTES = 8192
+_SEEN_WINDOW_BITS = _SEEN_WINDOW_BYTES * 8
+
+# Malformed-packet warnings are sampled so a flood of bad traffic
+# cannot turn the receive loop into a stdout-writing loop: each kind
+# of warning is emitted on its first hit, then once per N hits or per
+# interval, whichever comes first
+_WARN_SAMPLE_EVERY = 1000
+_WARN_INTERVAL = 5.0
+
+logger = logging.getLogger(__name__)
+
+# Optional native per-packet state kernel (numba). Deferred to first
+# use so the JIT toolchain is only imported when a server starts,
+# mirroring the encode-kernel loader in protocol.py.
+_state_kernel = None
+_state_kernel_checked = False
+
+
+def _load_state_kernel():
+    """Import the numba-compiled duplicate/gap kernel on first use."""
+    global _state_kernel, _state_kernel_checked
+
+    if _state_kernel_checked:
+        return _state_kernel
+
+    _state_kernel_checked = True
+
+    if numpy is None:
+        return None
+
+    try:
+        from ._state_nb import process_packet
+    except ImportError:
+        try:
+            from _state_nb import process_packet
+        except ImportError:
+            return None
+
+    _state_kernel = process_packet
+    return _state_kernel
+
+
+class _Iovec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+
+class _Msghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_Iovec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _Mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _Msghdr),
+        ('msg_len', ctypes.c_uint32),
+    ]
+
+
+class _SockaddrIn(ctypes.Structure):
+    _fields_ = [
+        ('sin_family', ctypes.c_uint16),
+        ('sin_port', ctypes.c_uint16),
+        ('sin_addr', ctypes.c_ubyte * 4),
+        ('sin_zero', ctypes.c_ubyte * 8),
+    ]
+
+
+class _Cmsghdr(ctypes.Structure):
+    _fields_ = [
+        ('cmsg_len', ctypes.c_size_t),
+        ('cmsg_level', ctypes.c_int),
+        ('cmsg_type', ctypes.c_int),
+    ]
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_long),
+        ('tv_nsec', ctypes.c_long),
+    ]
+
 
 @dataclass
 class DeviceState:
@@ -36,8 +176,59 @@ class DeviceState:
     total_packets: int = 0  # Total packets received
     duplicate_count: int = 0  # Duplicate packets detected
     gap_count: int = 0  # Total missing packets
-    seen_sequences: Set[int] = field(default_factory=set)  # For duplicate detection
-    reorder_buffer: List[Tuple[int, int, dict]] = field(default_factory=list)  # (seq, timestamp, data)
+    seen_bits: bytearray = field(
+        default_factory=lambda: bytearray(_SEEN_WINDOW_BYTES)
+    )  # Sliding-window bitset for duplicate detection
+    seen_head: int = -1  # Highest sequence marked in seen_bits
+    reorder_buffer: List[Tuple[int, int, dict]] = field(default_factory=list)  # (timestamp, seq, data) min-heap
+    # SoA reorder columns (numpy path): parallel primitive arrays plus
+    # an object column for the packets, valid through rb_len. The sort
+    # key lives in one contiguous integer array instead of being spread
+    # across boxed tuples.
+    rb_ts: Optional['numpy.ndarray'] = None
+    rb_seq: Optional['numpy.ndarray'] = None
+    rb_arrival: Optional['numpy.ndarray'] = None
+    rb_pkt: Optional['numpy.ndarray'] = None
+    rb_len: int = 0
+
+
+@dataclass
+class Packet:
+    """A parsed telemetry packet with fixed-offset fields.
+
+    Slots keep field access at a fixed offset instead of a hashed dict
+    lookup and avoid allocating a per-packet __dict__ on the hot path.
+    Declared explicitly rather than via dataclass(slots=True), which
+    needs Python 3.10; the repo supports 3.7+.
+    """
+    __slots__ = ('version', 'msg_type', 'device_id', 'sequence_number',
+                 'timestamp', 'readings', 'reading_count')
+    version: int
+    msg_type: int
+    device_id: int
+    sequence_number: int
+    timestamp: int
+    readings: Optional[list]
+    reading_count: int
+
+
+# Message-type display names, resolved once instead of a per-packet
+# conditional
+_MSG_TYPE_NAMES = {MSG_TYPE_DATA: 'DATA', MSG_TYPE_HEARTBEAT: 'HEARTBEAT'}
+
+# Pre-baked row format for the fixed 9-column log schema. No field can
+# contain a comma or quote (ints, a float, and known short tokens), so
+# the generic csv quoting scan buys nothing; one %-format per row
+# replaces the writer dispatch. The \r\n terminator and the True/False
+# flag tokens match what csv.writer emitted, since metrics.py and the
+# test harness parse the flags as 'true'/'false' strings.
+_ROW_FMT = '%d,%d,%d,%.6f,%s,%s,%s,%d,%d\r\n'
+_BOOL_STR = ('False', 'True')
+
+# Bound on row batches queued to the writer thread; beyond this the
+# batch is dropped (and counted) instead of backpressuring the receive
+# path into kernel-level packet drops
+_ROW_QUEUE_BATCHES = 256
 
 
 class CollectorServer:
@@ -53,15 +244,17 @@ class CollectorServer:
     """
     
     def __init__(self, listen_port: int = 5000, log_file: str = "output/telemetry.csv",
-                 reorder_window: int = 10, reorder_timeout: float = 2.0):
+                 reorder_window: int = 10, reorder_timeout: float = 2.0,
+                 rcvbuf_mb: int = 16):
         """
         Initialize the collector server.
-        
+
         Args:
             listen_port: UDP port to listen on
             log_file: Path to CSV log file
             reorder_window: Maximum buffer size for reordering
             reorder_timeout: Maximum time to buffer packets (seconds)
+            rcvbuf_mb: Requested kernel receive buffer size (MB)
         """
         self.listen_port = listen_port
         self.log_file = Path(log_file)
@@ -69,21 +262,97 @@ class CollectorServer:
         self.reorder_timeout = reorder_timeout
         
         # Initialize device states dictionary
-        self.device_states: Dict[int, DeviceState] = {}
+        # Device states: IDs map once to a dense [0, N) index and the
+        # states live in a list, so the per-packet lookup is one dict
+        # probe plus an O(1) list load instead of two hashed probes
+        self._dev_idx: Dict[int, int] = {}
+        self._dev_states: List[DeviceState] = []
         
         # Initialize UDP socket
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        # Deepen the kernel receive queue: the default SO_RCVBUF (often
+        # ~208 KB) overflows during back-to-back bursts and the kernel
+        # drops datagrams before Python ever sees them. The kernel may
+        # cap the request at net.core.rmem_max, so report the granted
+        # size rather than the requested one.
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                               rcvbuf_mb * 1024 * 1024)
+        granted = self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
         self.socket.bind(('0.0.0.0', self.listen_port))
+
+        # Readiness poller with a timeout: waiting at most
+        # reorder_timeout for traffic lets the flush path in run() fire
+        # on schedule during quiet periods instead of blocking until
+        # the next packet arrives. epoll where available (Linux),
+        # select with the same timeout elsewhere.
+        if hasattr(select, 'epoll'):
+            self._poller = select.epoll()
+            self._poller.register(self.socket.fileno(), select.EPOLLIN)
+        else:
+            self._poller = None
         
+        # Preallocated receive ring for the recvmmsg path: one
+        # MAX_PAYLOAD_SIZE slot, iovec, msghdr and sockaddr per batch
+        # entry, built once so receiving allocates nothing
+        if _recvmmsg is not None:
+            self._rx_buf = bytearray(_RECVMMSG_VLEN * MAX_PAYLOAD_SIZE)
+            self._rx_mv = memoryview(self._rx_buf)
+            self._rx_c = (ctypes.c_char * len(self._rx_buf)) \
+                .from_buffer(self._rx_buf)
+            base = ctypes.addressof(self._rx_c)
+            self._rx_iovecs = (_Iovec * _RECVMMSG_VLEN)()
+            self._rx_addrs = (_SockaddrIn * _RECVMMSG_VLEN)()
+            self._rx_msgs = (_Mmsghdr * _RECVMMSG_VLEN)()
+            for i in range(_RECVMMSG_VLEN):
+                self._rx_iovecs[i].iov_base = base + i * MAX_PAYLOAD_SIZE
+                self._rx_iovecs[i].iov_len = MAX_PAYLOAD_SIZE
+                hdr = self._rx_msgs[i].msg_hdr
+                hdr.msg_name = ctypes.cast(ctypes.byref(self._rx_addrs[i]),
+                                           ctypes.c_void_p)
+                hdr.msg_namelen = ctypes.sizeof(_SockaddrIn)
+                hdr.msg_iov = ctypes.pointer(self._rx_iovecs[i])
+                hdr.msg_iovlen = 1
+
+        # Kernel arrival timestamps: request an SCM_TIMESTAMPNS control
+        # message per datagram and point each msghdr at a slot in one
+        # aligned control buffer. Falls back to one wall-clock read per
+        # burst if the kernel rejects the option.
+        self._kernel_ts = False
+        if _recvmmsg is not None:
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, _SO_TIMESTAMPNS, 1)
+            except OSError:
+                pass
+            else:
+                self._kernel_ts = True
+                self._rx_ctrl = (ctypes.c_ulonglong *
+                                 (_CMSG_SLOT // 8 * _RECVMMSG_VLEN))()
+                ctrl_base = ctypes.addressof(self._rx_ctrl)
+                for i in range(_RECVMMSG_VLEN):
+                    hdr = self._rx_msgs[i].msg_hdr
+                    hdr.msg_control = ctrl_base + i * _CMSG_SLOT
+                    hdr.msg_controllen = _CMSG_SLOT
+
         # Initialize CSV log file
         self._init_csv_log()
         
         # Initialize CPU profiling
         self.total_cpu_time = 0.0
         self.packets_processed = 0
+
+        # Native duplicate/gap kernel, or None to run the interpreted
+        # pipeline; resolved once so the hot loop tests a bound attribute
+        self._state_kernel = _load_state_kernel()
+
+        # Rate-limited warning state, keyed by warning kind
+        self._warn_counts: collections.Counter = collections.Counter()
+        self._last_warn_emit: Dict[str, float] = {}
         
         print(f"CollectorServer initialized on port {self.listen_port}")
+        print(f"Receive buffer: requested {rcvbuf_mb} MB, granted {granted} bytes")
         print(f"Logging to: {self.log_file}")
     
     def _init_csv_log(self):
@@ -91,17 +360,30 @@ class CollectorServer:
         # Create output directory if it doesn't exist
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Open CSV file and write headers
-        self.csv_file = open(self.log_file, 'w', newline='')
-        self.csv_writer = csv.writer(self.csv_file)
-        
+        # Open CSV file with a large block buffer; rows accumulate there
+        # and reach the kernel in big writes instead of one flush
+        # syscall every few packets. The buffer is flushed and fsynced
+        # once, in _cleanup.
+        self.csv_file = open(self.log_file, 'w', newline='',
+                             buffering=1 << 20)
+
         # Write header row
-        headers = [
-            'device_id', 'seq', 'timestamp', 'arrival_time',
-            'msg_type', 'duplicate_flag', 'gap_flag', 'gap_size', 'reading_count'
-        ]
-        self.csv_writer.writerow(headers)
-        self.csv_file.flush()
+        self.csv_file.write(
+            'device_id,seq,timestamp,arrival_time,'
+            'msg_type,duplicate_flag,gap_flag,gap_size,reading_count\r\n'
+        )
+
+        # Row accumulator: log_packet appends formatted lines here and
+        # full batches are handed to the writer thread
+        self._row_buffer: list = []
+
+        # Writer thread and its bounded hand-off queue: file writes
+        # (and any disk stalls behind them) happen off the receive path
+        self._row_q: queue.Queue = queue.Queue(maxsize=_ROW_QUEUE_BATCHES)
+        self.rows_dropped = 0
+        self._writer_thread = threading.Thread(target=self._writer_worker,
+                                               daemon=True)
+        self._writer_thread.start()
 
     def get_or_create_device_state(self, device_id: int) -> DeviceState:
         """
@@ -113,98 +395,253 @@ class CollectorServer:
         Returns:
             DeviceState object for the device
         """
-        if device_id not in self.device_states:
-            self.device_states[device_id] = DeviceState(device_id=device_id)
+        idx = self._dev_idx.get(device_id)
+        if idx is None:
+            state = DeviceState(device_id=device_id)
+            if self._state_kernel is not None:
+                # The native kernel indexes the bitset as a typed array
+                state.seen_bits = numpy.zeros(_SEEN_WINDOW_BYTES,
+                                              dtype=numpy.uint8)
+            self._dev_idx[device_id] = len(self._dev_states)
+            self._dev_states.append(state)
             print(f"Initialized state for device {device_id}")
-        
-        return self.device_states[device_id]
+            return state
+
+        return self._dev_states[idx]
 
-    def receive_packet(self) -> Optional[Tuple[dict, float]]:
+    def _recv_batch(self) -> List[Tuple[bytes, tuple, float]]:
         """
-        Receive and parse a UDP packet.
-        
+        Receive a burst of UDP datagrams with one syscall.
+
+        Waits up to reorder_timeout for the socket to become readable,
+        then drains up to _RECVMMSG_VLEN queued datagrams via recvmmsg
+        with MSG_DONTWAIT so a partially filled batch returns
+        immediately instead of blocking for the remainder. Where libc
+        lacks recvmmsg, falls back to a single recvfrom after the same
+        readiness wait.
+
         Returns:
-            Tuple of (parsed_packet_dict, arrival_time) or None if invalid
-            
-        The parsed_packet_dict contains:
+            List of (data, addr, arrival_time) tuples; empty if the
+            wait timed out (so the caller can run its periodic flush)
+        """
+        if not self._wait_readable():
+            return []
+
+        if _recvmmsg is None:
+            data, addr = self.socket.recvfrom(MAX_PAYLOAD_SIZE)
+            return [(data, addr, time.time())]
+
+        msgs = self._rx_msgs
+        kernel_ts = self._kernel_ts
+        # The kernel overwrites namelen (and controllen, when timestamps
+        # are on) with the actual sizes, so both must be restored before
+        # every call
+        namelen = ctypes.sizeof(_SockaddrIn)
+        for i in range(_RECVMMSG_VLEN):
+            hdr = msgs[i].msg_hdr
+            hdr.msg_namelen = namelen
+            if kernel_ts:
+                hdr.msg_controllen = _CMSG_SLOT
+
+        count = _recvmmsg(self.socket.fileno(), ctypes.byref(msgs),
+                          _RECVMMSG_VLEN, _MSG_DONTWAIT, None)
+        if count <= 0:
+            return []
+
+        # Fallback arrival time, and the value used for every datagram
+        # when kernel timestamps are off: one clock read per burst
+        batch_time = time.time()
+        cmsg_min = ctypes.sizeof(_Cmsghdr) + ctypes.sizeof(_Timespec)
+        batch = []
+        for i in range(count):
+            start = i * MAX_PAYLOAD_SIZE
+            data = bytes(self._rx_mv[start:start + msgs[i].msg_len])
+            sa = self._rx_addrs[i]
+            addr = (socket.inet_ntoa(bytes(sa.sin_addr)),
+                    socket.ntohs(sa.sin_port))
+
+            arrival_time = batch_time
+            if kernel_ts:
+                hdr = msgs[i].msg_hdr
+                if hdr.msg_controllen >= cmsg_min:
+                    cm = _Cmsghdr.from_address(hdr.msg_control)
+                    if (cm.cmsg_level == socket.SOL_SOCKET
+                            and cm.cmsg_type == _SCM_TIMESTAMPNS):
+                        ts = _Timespec.from_address(
+                            hdr.msg_control + ctypes.sizeof(_Cmsghdr))
+                        arrival_time = ts.tv_sec + ts.tv_nsec * 1e-9
+
+            batch.append((data, addr, arrival_time))
+
+        return batch
+
+    def _wait_readable(self) -> bool:
+        """
+        Block until the socket is readable or reorder_timeout elapses.
+
+        Returns:
+            True if a datagram is waiting, False on timeout
+        """
+        if self._poller is not None:
+            return bool(self._poller.poll(self.reorder_timeout))
+
+        ready, _, _ = select.select([self.socket], [], [],
+                                    self.reorder_timeout)
+        return bool(ready)
+
+    def _should_emit_warn(self, key: str) -> bool:
+        """
+        Decide whether a warning of the given kind should be emitted.
+
+        Counts every hit but lets one through on the first occurrence,
+        then every _WARN_SAMPLE_EVERY hits or after _WARN_INTERVAL
+        seconds of silence, so a misbehaving sender cannot stall the
+        receive loop on stdout writes.
+        """
+        self._warn_counts[key] += 1
+        count = self._warn_counts[key]
+        now = time.monotonic()
+
+        if (count == 1 or count % _WARN_SAMPLE_EVERY == 0
+                or now - self._last_warn_emit.get(key, 0.0) >= _WARN_INTERVAL):
+            self._last_warn_emit[key] = now
+            return True
+
+        return False
+
+    def _parse_packet(self, data: bytes, addr: tuple) -> Optional[Packet]:
+        """
+        Parse and validate a received UDP datagram.
+
+        Returns:
+            Packet instance or None if invalid
+
+        The Packet carries:
             - version, msg_type, device_id, sequence_number, timestamp (from header)
-            - readings: List of SensorReading objects (for DATA messages)
+            - readings: None (the logging path only needs the count, so
+              the payload is validated but never decoded)
             - reading_count: Number of readings (0 for HEARTBEAT)
         """
+        # Validate minimum size
+        if len(data) < HEADER_SIZE:
+            if self._should_emit_warn('short_packet'):
+                logger.warning('Packet too short (%d bytes) from %s',
+                               len(data), addr)
+            return None
+
+        # Decode header with the pre-compiled struct into locals; no
+        # dict construction or per-field hashed lookups
         try:
-            # Receive packet
-            data, addr = self.socket.recvfrom(MAX_PAYLOAD_SIZE)
-            arrival_time = time.time()
-            
-            # Validate minimum size
-            if len(data) < HEADER_SIZE:
-                print(f"Warning: Packet too short ({len(data)} bytes) from {addr}")
-                return None
-            
-            # Decode header
+            version, msg_type, device_id, sequence_number, timestamp = \
+                HEADER_STRUCT.unpack_from(data)
+        except struct.error as e:
+            if self._should_emit_warn('bad_header'):
+                logger.warning('Failed to decode header from %s: %s', addr, e)
+            return None
+
+        # Validate header: one combined predicate built from branchless
+        # comparisons, so a valid packet pays a single compare-and-branch
+        # instead of three; invalid packets detour to the cold path,
+        # which re-checks field by field for the right warning
+        if ((version != VERSION)
+                | ((msg_type != MSG_TYPE_DATA)
+                   & (msg_type != MSG_TYPE_HEARTBEAT))
+                | (device_id <= 0)):
+            self._reject_header(addr, version, msg_type, device_id)
+            return None
+
+        # Validate the payload and take its reading count; nothing
+        # downstream looks at the readings themselves, so the
+        # per-reading unpack and SensorReading construction are skipped
+        reading_count = 0
+        if msg_type == MSG_TYPE_DATA:
             try:
-                header = decode_header(data)
+                reading_count = count_readings(data[HEADER_SIZE:])
             except (ValueError, struct.error) as e:
-                print(f"Warning: Failed to decode header from {addr}: {e}")
+                if self._should_emit_warn('bad_payload'):
+                    logger.warning('Failed to decode DATA payload from %s: %s',
+                                   addr, e)
                 return None
-            
-            # Validate header
-            if header['version'] != VERSION:
-                print(f"Warning: Invalid version {header['version']} from {addr}")
-                return None
-            
-            if header['msg_type'] not in (MSG_TYPE_DATA, MSG_TYPE_HEARTBEAT):
-                print(f"Warning: Invalid message type {header['msg_type']} from {addr}")
-                return None
-            
-            if header['device_id'] <= 0:
-                print(f"Warning: Invalid device_id {header['device_id']} from {addr}")
-                return None
-            
-            # Build packet dictionary
-            packet = {
-                'version': header['version'],
-                'msg_type': header['msg_type'],
-                'device_id': header['device_id'],
-                'sequence_number': header['sequence_number'],
-                'timestamp': header['timestamp'],
-                'readings': [],
-                'reading_count': 0
-            }
-            
-            # Decode payload based on message type
-            if header['msg_type'] == MSG_TYPE_DATA:
-                try:
-                    payload = data[HEADER_SIZE:]
-                    readings = decode_data_payload(payload)
-                    packet['readings'] = readings
-                    packet['reading_count'] = len(readings)
-                except (ValueError, struct.error) as e:
-                    print(f"Warning: Failed to decode DATA payload from {addr}: {e}")
-                    return None
-            
-            return (packet, arrival_time)
-            
-        except Exception as e:
-            print(f"Error receiving packet: {e}")
-            return None
+
+        return Packet(
+            version=version,
+            msg_type=msg_type,
+            device_id=device_id,
+            sequence_number=sequence_number,
+            timestamp=timestamp,
+            readings=None,
+            reading_count=reading_count
+        )
+
+    def _reject_header(self, addr: tuple, version: int, msg_type: int,
+                       device_id: int):
+        """
+        Emit the rate-limited warning for an invalid header.
+
+        Cold path: re-runs the individual field checks so each kind of
+        failure keeps its own warning category and message, matching
+        the order the sequential validation used.
+        """
+        if version != VERSION:
+            if self._should_emit_warn('bad_version'):
+                logger.warning('Invalid version %s from %s', version, addr)
+        elif msg_type not in (MSG_TYPE_DATA, MSG_TYPE_HEARTBEAT):
+            if self._should_emit_warn('bad_msg_type'):
+                logger.warning('Invalid message type %s from %s',
+                               msg_type, addr)
+        elif device_id <= 0:
+            if self._should_emit_warn('bad_device_id'):
+                logger.warning('Invalid device_id %s from %s', device_id, addr)
 
     def check_duplicate(self, device_state: DeviceState, sequence_number: int) -> bool:
         """
         Check if a packet is a duplicate based on sequence number.
-        
+
+        Sequence numbers map onto a fixed bitset covering the most
+        recent 64K values (sequence mod window), so memory stays O(1)
+        per device instead of growing with every packet seen, and the
+        lookup is two loads and a mask rather than a hashed set probe.
+        The window slides with the highest sequence marked (seen_head):
+        when a packet advances the head, the bit positions that re-enter
+        the window — set a full window ago by sequences that alias onto
+        them — are cleared first, so a monotonic counter passing 64K
+        never misreads stale bits as duplicates. Only sequences that
+        have fallen more than a window behind the head can still alias.
+
         Args:
             device_state: Device state object
             sequence_number: Sequence number to check
-            
+
         Returns:
             True if duplicate, False if new
         """
-        if sequence_number in device_state.seen_sequences:
+        seen = device_state.seen_bits
+        head = device_state.seen_head
+
+        if sequence_number > head:
+            # A new high sequence cannot be a duplicate. Slide the
+            # window up to it, clearing the positions that wrapped in
+            # (one pass over the bitset at most, for a whole-window jump)
+            if sequence_number - head >= _SEEN_WINDOW_BITS:
+                seen[:] = bytes(_SEEN_WINDOW_BYTES)
+            else:
+                for s in range(head + 1, sequence_number):
+                    b, bit = divmod(s & 0xFFFF, 8)
+                    seen[b] &= ~(1 << bit)
+            device_state.seen_head = sequence_number
+
+            byte, bit = divmod(sequence_number & 0xFFFF, 8)
+            seen[byte] |= 1 << bit
+            return False
+
+        byte, bit = divmod(sequence_number & 0xFFFF, 8)
+        mask = 1 << bit
+
+        if seen[byte] & mask:
             device_state.duplicate_count += 1
             return True
-        
-        device_state.seen_sequences.add(sequence_number)
+
+        seen[byte] |= mask
         return False
 
     def detect_gap(self, device_state: DeviceState, sequence_number: int) -> int:
@@ -241,7 +678,7 @@ class CollectorServer:
         
         return gap_size
 
-    def add_to_reorder_buffer(self, device_state: DeviceState, packet: dict, arrival_time: float):
+    def add_to_reorder_buffer(self, device_state: DeviceState, packet: Packet, arrival_time: float):
         """
         Add packet to reordering buffer for timestamp-based reordering.
         
@@ -250,35 +687,88 @@ class CollectorServer:
         (not arrival time) to restore the correct temporal order.
         
         Buffer management:
-        - Packets are stored as (seq, timestamp, data) tuples
+        - The buffer is a min-heap of (timestamp, seq, data) tuples, so
+          the oldest packet (by timestamp) is always at the root
         - Buffer size is limited to reorder_window (default: 10 packets)
-        - When buffer is full, oldest packet (by timestamp) is removed
-        
+        - When buffer is full, the oldest packet is popped in O(log N)
+          instead of re-sorting the whole buffer per insert
+
+        When numpy is available the buffer instead lives in per-device
+        structure-of-arrays columns (see _add_to_reorder_soa), which keep
+        the sort keys in contiguous primitive arrays rather than boxed
+        heap tuples.
+
         Args:
             device_state: Device state object
-            packet: Parsed packet dictionary
+            packet: Parsed Packet instance
             arrival_time: Packet arrival timestamp
         """
-        # Add packet to buffer as (seq, timestamp, packet_data) tuple
-        # We store both sequence and timestamp for sorting flexibility
-        buffer_entry = (
-            packet['sequence_number'],
-            packet['timestamp'],
+        if numpy is not None:
+            self._add_to_reorder_soa(device_state, packet, arrival_time)
+            return
+
+        # Push as (timestamp, seq, packet_data): timestamp first so the
+        # heap orders by sensor time, seq as a deterministic tiebreaker
+        heapq.heappush(device_state.reorder_buffer, (
+            packet.timestamp,
+            packet.sequence_number,
             {
                 'packet': packet,
                 'arrival_time': arrival_time
             }
-        )
-        
-        device_state.reorder_buffer.append(buffer_entry)
-        
+        ))
+
         # Limit buffer size to reorder_window to prevent unbounded memory growth
         if len(device_state.reorder_buffer) > self.reorder_window:
-            # Sort by timestamp and remove oldest entry
-            device_state.reorder_buffer.sort(key=lambda x: x[1])
-            device_state.reorder_buffer.pop(0)
-    
-    def flush_reorder_buffer(self, device_state: DeviceState) -> List[Tuple[dict, float]]:
+            heapq.heappop(device_state.reorder_buffer)
+
+    def _add_to_reorder_soa(self, device_state: DeviceState, packet: Packet,
+                            arrival_time: float):
+        """
+        Append a packet to the SoA reorder columns (numpy path).
+
+        Writes the sort keys (timestamp, seq) and arrival time into
+        parallel primitive arrays and the packet into an object column;
+        only scalar stores run per packet. On overflow the oldest entry
+        by timestamp is evicted with an argmin scan over the small
+        contiguous key array (window is ~10 entries) and the tail entry
+        swapped into its slot.
+
+        Args:
+            device_state: Device state object
+            packet: Parsed Packet instance
+            arrival_time: Packet arrival timestamp
+        """
+        ds = device_state
+        if ds.rb_ts is None:
+            # One slot beyond the window so eviction runs after insert
+            cap = self.reorder_window + 1
+            ds.rb_ts = numpy.empty(cap, dtype=numpy.uint64)
+            ds.rb_seq = numpy.empty(cap, dtype=numpy.uint64)
+            ds.rb_arrival = numpy.empty(cap, dtype=numpy.float64)
+            ds.rb_pkt = numpy.empty(cap, dtype=object)
+
+        i = ds.rb_len
+        ds.rb_ts[i] = packet.timestamp
+        ds.rb_seq[i] = packet.sequence_number
+        ds.rb_arrival[i] = arrival_time
+        ds.rb_pkt[i] = packet
+        ds.rb_len = i + 1
+
+        # Limit buffer size to reorder_window to prevent unbounded memory growth
+        if ds.rb_len > self.reorder_window:
+            last = ds.rb_len - 1
+            j = int(ds.rb_ts[:ds.rb_len].argmin())
+            if j != last:
+                ds.rb_ts[j] = ds.rb_ts[last]
+                ds.rb_seq[j] = ds.rb_seq[last]
+                ds.rb_arrival[j] = ds.rb_arrival[last]
+                ds.rb_pkt[j] = ds.rb_pkt[last]
+            ds.rb_pkt[last] = None  # release the evicted packet
+            ds.rb_len = last
+
+
+    def flush_reorder_buffer(self, device_state: DeviceState) -> List[Tuple[Packet, float]]:
         """
         Flush and sort reorder buffer by timestamp.
         
@@ -296,128 +786,201 @@ class CollectorServer:
         Returns:
             List of (packet, arrival_time) tuples sorted by timestamp
         """
-        if not device_state.reorder_buffer:
+        if numpy is not None:
+            return self._flush_reorder_soa(device_state)
+
+        buf = device_state.reorder_buffer
+        if not buf:
             return []
-        
-        # Sort buffer by timestamp (index 1 in tuple: seq, timestamp, data)
-        device_state.reorder_buffer.sort(key=lambda x: x[1])
-        
-        # Extract packets from buffer entries
-        sorted_packets = [
-            (entry[2]['packet'], entry[2]['arrival_time'])
-            for entry in device_state.reorder_buffer
-        ]
-        
-        # Clear buffer after flushing
-        device_state.reorder_buffer.clear()
-        
+
+        # Drain the heap: repeated pops come out in timestamp order, so
+        # no separate sort pass is needed
+        sorted_packets = []
+        while buf:
+            entry = heapq.heappop(buf)[2]
+            sorted_packets.append((entry['packet'], entry['arrival_time']))
+
+        return sorted_packets
+
+    def _flush_reorder_soa(self, device_state: DeviceState) -> List[Tuple[Packet, float]]:
+        """
+        Drain the SoA reorder columns in timestamp order (numpy path).
+
+        One lexsort over the contiguous key columns replaces the
+        tuple-comparison heap drain: timestamp is the primary key with
+        seq as the deterministic tiebreaker, matching the heap ordering.
+
+        Args:
+            device_state: Device state object
+
+        Returns:
+            List of (packet, arrival_time) tuples sorted by timestamp
+        """
+        ds = device_state
+        n = ds.rb_len
+        if n == 0:
+            return []
+
+        order = numpy.lexsort((ds.rb_seq[:n], ds.rb_ts[:n]))
+        sorted_packets = [(ds.rb_pkt[k], ds.rb_arrival[k]) for k in order]
+
+        ds.rb_pkt[:n] = None  # release packet references
+        ds.rb_len = 0
+
         return sorted_packets
 
-    def log_packet(self, packet: dict, arrival_time: float, 
+    def log_packet(self, packet: Packet, arrival_time: float, 
                    duplicate_flag: bool, gap_flag: bool, gap_size: int):
         """
         Log packet to CSV file.
         
         Args:
-            packet: Parsed packet dictionary
+            packet: Parsed Packet instance
             arrival_time: Packet arrival timestamp
             duplicate_flag: True if packet is duplicate
             gap_flag: True if gap detected
             gap_size: Number of missing packets (0 if no gap)
         """
-        # Determine message type string
-        msg_type_str = 'DATA' if packet['msg_type'] == MSG_TYPE_DATA else 'HEARTBEAT'
-        
-        # Write CSV row
-        row = [
-            packet['device_id'],
-            packet['sequence_number'],
-            packet['timestamp'],
-            f"{arrival_time:.6f}",
-            msg_type_str,
-            duplicate_flag,
-            gap_flag,
+        # Format the whole row with the pre-baked schema string: one
+        # C-level %-format instead of the csv writer's per-field type
+        # inspection and quote scan
+        line = _ROW_FMT % (
+            packet.device_id,
+            packet.sequence_number,
+            packet.timestamp,
+            arrival_time,
+            _MSG_TYPE_NAMES[packet.msg_type],
+            _BOOL_STR[duplicate_flag],
+            _BOOL_STR[gap_flag],
             gap_size,
-            packet['reading_count']
-        ]
-        
-        self.csv_writer.writerow(row)
-        
-        # Flush periodically (every 10 packets or based on time)
-        if not hasattr(self, '_packet_count'):
-            self._packet_count = 0
-            self._last_flush_time = time.time()
-        
-        self._packet_count += 1
-        current_time = time.time()
-        
-        if self._packet_count >= 10 or (current_time - self._last_flush_time) >= 1.0:
+            packet.reading_count
+        )
+
+        # Accumulate; full batches reach the file in one joined write,
+        # and the periodic flush in run() drains stragglers
+        self._row_buffer.append(line)
+        if len(self._row_buffer) >= 1024:
+            self._drain_rows()
+
+    def _drain_rows(self):
+        """Hand the accumulated row batch to the writer thread."""
+        if self._row_buffer:
             try:
-                self.csv_file.flush()
-                self._packet_count = 0
-                self._last_flush_time = current_time
-            except Exception as e:
-                print(f"Warning: Failed to flush CSV file: {e}")
+                self._row_q.put_nowait(self._row_buffer)
+            except queue.Full:
+                self.rows_dropped += len(self._row_buffer)
+            # Ownership of the batch moved to the queue; start a new one
+            self._row_buffer = []
+
+    def _writer_worker(self):
+        """
+        Drain queued row batches into the CSV file.
+
+        Runs as a daemon thread: the write syscalls (and any disk
+        stalls behind them) happen here instead of on the receive path,
+        and the GIL is released around the writes. A None sentinel
+        (posted during shutdown) stops the worker.
+        """
+        out = self.csv_file
+        while True:
+            batch = self._row_q.get()
+            if batch is None:
+                break
+            out.write(''.join(batch))
 
     def run(self):
         """
         Main server loop.
         
-        Continuously receives packets, processes them through the pipeline:
+        Continuously receives packet bursts, feeding each datagram
+        through the pipeline:
         parse → check duplicate → detect gap → buffer → log
-        
-        Handles graceful shutdown on Ctrl+C.
+
+        Handles graceful shutdown on Ctrl+C or SIGTERM.
         """
+        # Route SIGTERM (how the test harness stops the server) through
+        # the same shutdown path as Ctrl+C: with logging now fully
+        # buffered, dying without _cleanup would drop the buffered rows
+        import signal
+
+        def _terminate(signum, frame):
+            raise KeyboardInterrupt
+
+        signal.signal(signal.SIGTERM, _terminate)
+
         print("CollectorServer running. Press Ctrl+C to stop.")
-        
-        last_flush_time = time.time()
-        
+
+        last_flush_time = time.monotonic()
+
         try:
             while True:
-                # Receive and parse packet
-                result = self.receive_packet()
-                if result is None:
-                    continue
-                
-                # Start CPU time measurement for packet processing
-                process_start_cpu = time.process_time()
-                
-                packet, arrival_time = result
-                device_id = packet['device_id']
-                sequence_number = packet['sequence_number']
-                
-                # Get or create device state
-                device_state = self.get_or_create_device_state(device_id)
-                device_state.total_packets += 1
-                
-                # Check for duplicate
-                is_duplicate = self.check_duplicate(device_state, sequence_number)
-                
-                # Detect gap (only for non-duplicates)
-                gap_size = 0
-                gap_flag = False
-                if not is_duplicate:
-                    gap_size = self.detect_gap(device_state, sequence_number)
-                    gap_flag = gap_size > 0
-                
-                # Add to reorder buffer (for non-duplicates)
-                if not is_duplicate:
-                    self.add_to_reorder_buffer(device_state, packet, arrival_time)
-                
-                # Log packet
-                self.log_packet(packet, arrival_time, is_duplicate, gap_flag, gap_size)
-                
-                # End CPU time measurement
-                process_end_cpu = time.process_time()
-                self.total_cpu_time += (process_end_cpu - process_start_cpu)
-                self.packets_processed += 1
-                
-                # Periodically flush reorder buffers
-                current_time = time.time()
+                # Receive a burst of datagrams (one syscall on Linux)
+                batch = self._recv_batch()
+
+                if batch:
+                    # One CPU-time bracket per burst rather than per
+                    # packet: two clock reads amortize over the batch
+                    process_start_cpu = time.process_time()
+
+                    for data, addr, arrival_time in batch:
+                        # Parse and validate packet
+                        packet = self._parse_packet(data, addr)
+                        if packet is None:
+                            continue
+
+                        device_id = packet.device_id
+                        sequence_number = packet.sequence_number
+
+                        # Get or create device state
+                        device_state = self.get_or_create_device_state(device_id)
+                        device_state.total_packets += 1
+
+                        # Duplicate check and gap detection: one native
+                        # kernel call when numba is available, otherwise
+                        # the interpreted methods
+                        if self._state_kernel is not None:
+                            (is_duplicate, gap_size, device_state.last_seq,
+                             device_state.seen_head) = \
+                                self._state_kernel(sequence_number,
+                                                   device_state.last_seq,
+                                                   device_state.seen_head,
+                                                   device_state.seen_bits)
+                            if is_duplicate:
+                                device_state.duplicate_count += 1
+                            elif gap_size:
+                                device_state.gap_count += gap_size
+                            gap_flag = gap_size > 0
+                        else:
+                            is_duplicate = self.check_duplicate(device_state, sequence_number)
+
+                            # Detect gap (only for non-duplicates)
+                            gap_size = 0
+                            gap_flag = False
+                            if not is_duplicate:
+                                gap_size = self.detect_gap(device_state, sequence_number)
+                                gap_flag = gap_size > 0
+
+                        # Add to reorder buffer (for non-duplicates)
+                        if not is_duplicate:
+                            self.add_to_reorder_buffer(device_state, packet, arrival_time)
+
+                        # Log packet
+                        self.log_packet(packet, arrival_time, is_duplicate, gap_flag, gap_size)
+
+                        self.packets_processed += 1
+
+                    self.total_cpu_time += time.process_time() - process_start_cpu
+
+                # Periodically flush reorder buffers and drain any
+                # partially filled row batch so low-rate streams are
+                # not stuck in the accumulator; checked once per burst
+                # against the monotonic clock (immune to NTP steps)
+                current_time = time.monotonic()
                 if current_time - last_flush_time >= self.reorder_timeout:
-                    for dev_state in self.device_states.values():
+                    for dev_state in self._dev_states:
                         sorted_packets = self.flush_reorder_buffer(dev_state)
                         # Note: Sorted packets are already logged, this is for buffer management
+                    self._drain_rows()
                     last_flush_time = current_time
         
         except KeyboardInterrupt:
@@ -445,8 +1008,8 @@ class CollectorServer:
         print("SUMMARY STATISTICS")
         print("="*60)
         
-        for device_id, state in sorted(self.device_states.items()):
-            print(f"\nDevice {device_id}:")
+        for state in sorted(self._dev_states, key=lambda s: s.device_id):
+            print(f"\nDevice {state.device_id}:")
             print(f"  Total packets: {state.total_packets}")
             print(f"  Duplicates: {state.duplicate_count}")
             print(f"  Gaps detected: {state.gap_count} missing packets")
@@ -457,15 +1020,31 @@ class CollectorServer:
         print(f"  Total packets processed: {self.packets_processed}")
         print(f"  Total CPU time: {self.total_cpu_time:.6f}s")
         print(f"  CPU ms per packet: {self.get_cpu_ms_per_report():.3f}ms")
+        if self.rows_dropped:
+            print(f"  Log rows dropped (writer overrun): {self.rows_dropped}")
     
     def _cleanup(self):
         """Clean up resources."""
         try:
+            # Push the final partial batch, stop the writer thread, then
+            # one flush + fsync: everything the block buffer accumulated
+            # is durably on disk before close
+            self._drain_rows()
+            self._row_q.put(None)
+            self._writer_thread.join(timeout=5.0)
+            self.csv_file.flush()
+            os.fsync(self.csv_file.fileno())
             self.csv_file.close()
             print(f"CSV log saved to: {self.log_file}")
         except:
             pass
         
+        try:
+            if self._poller is not None:
+                self._poller.close()
+        except:
+            pass
+
         try:
             self.socket.close()
         except:
@@ -511,15 +1090,23 @@ def main():
         default=2.0,
         help='Maximum time to buffer packets (seconds)'
     )
-    
+
+    parser.add_argument(
+        '--rcvbuf-mb',
+        type=int,
+        default=16,
+        help='Requested kernel receive buffer size (MB)'
+    )
+
     args = parser.parse_args()
-    
+
     # Create and run server
     server = CollectorServer(
         listen_port=args.port,
         log_file=args.log_file,
         reorder_window=args.reorder_window,
-        reorder_timeout=args.reorder_timeout
+        reorder_timeout=args.reorder_timeout,
+        rcvbuf_mb=args.rcvbuf_mb
     )
     
     server.run()